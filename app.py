@@ -1,7 +1,9 @@
 # app.py
+import click
 from flask import Flask
 from config.settings import get_config
 from extensions.database import db, migrate
+import models
 from extensions.legacy_database import legacy_db
 from extensions.logger import init_logger
 from controllers.auth_controller import auth_bp
@@ -26,6 +28,9 @@ def create_app(config_name="development"):
     app = Flask(__name__)
     app.config.from_object(get_config(config_name))
 
+    # 注册全部模型（models 包按需导出，映射配置前需确保所有模型已加载）
+    models.load_all()
+
     # 初始化扩展
     db.init_app(app)
     migrate.init_app(app, db)
@@ -77,6 +82,14 @@ def create_app(config_name="development"):
     def _biz_err(e: BizError):
         return json_response(code=e.code, message=e.message, data=e.data)
 
+    # 定时校准执行批次计数（如 cron: flask reconcile-run-stats）
+    @app.cli.command("reconcile-run-stats")
+    def reconcile_run_stats():
+        from services.test_plan_service import TestPlanService
+
+        count = TestPlanService.reconcile_all_statistics()
+        click.echo(f"已校准 {count} 个测试计划的执行统计")
+
     return app
 
 
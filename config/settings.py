@@ -15,6 +15,14 @@ def _as_bool(val, default=False):
 class BaseConfig:
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # 主库连接池：结果录入并发写入较多，默认 5+10 的池子容易排队；LIFO 优先复用热连接
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 25)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 25)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+    }
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwt-secret-key")
     REDIS_URL = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
 
@@ -47,6 +55,9 @@ class BaseConfig:
     # Legacy system integration
     LEGACY_DATABASE_URI = os.getenv("LEGACY_DATABASE_URI")
     LEGACY_IMAGE_ROOT = os.getenv("LEGACY_IMAGE_ROOT")
+    LEGACY_DB_POOL_SIZE = int(os.getenv("LEGACY_DB_POOL_SIZE", 20))
+    LEGACY_DB_MAX_OVERFLOW = int(os.getenv("LEGACY_DB_MAX_OVERFLOW", 40))
+    LEGACY_DB_POOL_RECYCLE = int(os.getenv("LEGACY_DB_POOL_RECYCLE", 1800))
 
     # 默认管理员（首次启动自动创建，可选）
     ADMIN_INIT_USERNAME = os.getenv("ADMIN_INIT_USERNAME", "admin")
@@ -85,6 +96,8 @@ class ProductionConfig(BaseConfig):
 class TestingConfig(BaseConfig):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = os.getenv("TEST_DATABASE_URI", "sqlite:///:memory:")
+    # 内存 SQLite 使用 StaticPool，不接受连接池大小参数
+    SQLALCHEMY_ENGINE_OPTIONS = {}
 
 
 config_map = {
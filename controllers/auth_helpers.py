@@ -8,7 +8,7 @@ from flask import g, request
 
 from constants.department_roles import DepartmentRole
 from constants.roles import SystemRole
-from extensions.jwt import decode_token
+from middlewares.auth import decode_token_cached
 from repositories.user_repository import UserRepository
 from utils.permissions import (
     PermissionScope,
@@ -33,7 +33,7 @@ def _resolve_user_from_token(token: str):
     失败时抛出 (code, message) 的 ValueError，供调用方决定如何返回。
     """
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
     except ValueError:
         raise ValueError(("TOKEN_INVALID", "Token 无效或已过期"))
 
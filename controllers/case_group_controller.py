@@ -55,8 +55,8 @@ def get_case_group(group_id: int):
         "parent_id": group.parent_id,
         "department_id": group.department_id,
         "order_no": group.order_no,
-        "created_at": group.created_at.isoformat() if group.created_at else None,
-        "updated_at": group.updated_at.isoformat() if group.updated_at else None
+        "created_at": group.created_at,
+        "updated_at": group.updated_at
     })
 
 
@@ -10,7 +10,7 @@ from utils.permissions import (
     get_current_user,
     get_permission_scope,
 )
-from constants.roles import SystemRole
+from constants.roles import SystemRole, ROLE_LABELS_ZH
 from constants.department_roles import DEPARTMENT_ROLE_SET, DepartmentRole, DEPARTMENT_ROLE_LABELS_ZH
 from controllers.auth_helpers import auth_required, require_system_roles, require_department_role
 
@@ -92,7 +92,7 @@ def get_department(dept_id: int):
     # 如果需要限制只有管理员才能看 members，可以做：
     # if with_members and not user_is_dept_admin(dept_id):
     #     raise BusinessError("无权查看成员列表", 403)
-    _, _, counts_data = DepartmentService.list()
+    counts_data = DepartmentService.get_counts([dept.id])
     return json_response(data=dept.to_dict(counts_data=counts_data))
 
 
@@ -226,11 +226,11 @@ def list_members(dept_id: int):
                 "id": u.id,
                 "username": u.username,
                 "role": u.role,
-                "role_label": u.role_label,  # property (使用 ROLE_LABELS_ZH)
+                "role_label": ROLE_LABELS_ZH.get(u.role, u.role),
                 "email": u.email,
                 "phone": u.phone,
                 "active": u.active,
-                "created_at": u.created_at.isoformat() if u.created_at else None,
+                "created_at": u.created_at,
                 "departments": dept_map.get(u.id, []),
                 "department_member_id": dept_member.id if dept_member else None,
                 "department_role": dept_role,
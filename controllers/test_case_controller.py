@@ -76,7 +76,7 @@ def create_test_case():
             "status": test_case.status,
             "case_type": test_case.case_type,
             "version": test_case.version,
-            "created_at": test_case.created_at.isoformat()
+            "created_at": test_case.created_at
         }
     )
 
@@ -203,7 +203,7 @@ def _build_batch_import_response(cases_data: List[Dict[str, Any]], result: Dict[
             "case_type": case.case_type,
             "status": case.status,
             "version": case.version,
-            "created_at": case.created_at.isoformat() if case.created_at else None
+            "created_at": case.created_at
         })
 
     failures = result["errors"]
@@ -247,8 +247,8 @@ def get_test_case(case_id: int):
         "version": test_case.version,
         "created_by": test_case.created_by,
         "updated_by": test_case.updated_by,
-        "created_at": test_case.created_at.isoformat() if test_case.created_at else None,
-        "updated_at": test_case.updated_at.isoformat() if test_case.updated_at else None,
+        "created_at": test_case.created_at,
+        "updated_at": test_case.updated_at,
     }
 
     # 添加创建者和更新者信息
@@ -319,7 +319,7 @@ def update_test_case(case_id: int):
             "id": test_case.id,
             "title": test_case.title,
             "version": test_case.version,
-            "updated_at": test_case.updated_at.isoformat()
+            "updated_at": test_case.updated_at
         }
     )
 
@@ -388,8 +388,8 @@ def list_test_cases(department_id: int):
             "workload_minutes": tc.workload_minutes,
             "version": tc.version,
             "group_id": tc.group_id,
-            "created_at": tc.created_at.isoformat() if tc.created_at else None,
-            "updated_at": tc.updated_at.isoformat() if tc.updated_at else None
+            "created_at": tc.created_at,
+            "updated_at": tc.updated_at
         }
 
         # 添加创建者信息
@@ -467,7 +467,7 @@ def get_test_case_history(case_id: int):
             "change_type": history.change_type,
             "change_summary": history.change_summary,
             "changed_fields": history.changed_fields,
-            "operated_at": history.operated_at.isoformat(),
+            "operated_at": history.operated_at,
             "title": history.title,
             "priority": history.priority,
             "status": history.status,
@@ -4,12 +4,15 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from io import BytesIO
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Tuple
+from typing import Any, BinaryIO, Dict, List, Sequence, Tuple
 import json
 
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
 
 SKIP_PREFIX = (
     "Section :",
@@ -20,152 +23,217 @@ SKIP_PREFIX = (
 )
 STEP_SPLIT_RE = re.compile(r"(?:^|\n)\s*(\d+)[\.\)\、:：]\s*", re.M)
 TITLE_KEYWORD_RE = re.compile(r"\[([^\]]+)\]")  # capture inner token
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+_TITLE_STRIP = " -—_/"
+# 解析只用到 A（标题/步骤）、D（目录名）、E（预期结果）三列，读取到 E 列即可
+_MAX_COLUMN = 5
+# 步骤中暂不从 Excel 解析的字段，统一以空串补齐
+_EMPTY_STEP_EXTRA = {"keyword": "", "note": "", "expected": ""}
 
 
 def _normalize_text(value: Any) -> str:
+    # 常见单元格类型（str / None / float / int）走本地快速分支，
+    # 只有其他类型（NaT、pd.NA、时间戳等）才交给 pd.isna 判断
     if isinstance(value, str):
         text = value.strip()
         return "" if text.lower() == "nan" else text
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return "" if value != value else str(value)
+    if isinstance(value, int):
+        return str(value)
     if pd.isna(value):  # type: ignore[arg-type]
         return ""
     return str(value).strip()
 
 
-def extract_folder_name(df: pd.DataFrame) -> str:
-    if df.shape[0] > 1 and df.shape[1] > 3:
-        value = df.iloc[1, 3]
-        return _normalize_text(value)
+def extract_folder_name(col_d: Sequence[Any]) -> str:
+    if len(col_d) > 1:
+        return _normalize_text(col_d[1])
     return ""
 
 
-def find_header_idx(df: pd.DataFrame) -> int | None:
-    for i in range(len(df)):
-        v = _normalize_text(df.iloc[i, 0])
+def find_header_idx(col_a: Sequence[Any]) -> int | None:
+    for i, raw in enumerate(col_a):
+        v = _normalize_text(raw)
         if "Test case item" in v:
             return i
     return None
 
 
-def is_title_row(df: pd.DataFrame, index: int) -> bool:
-    title = _normalize_text(df.iloc[index, 0])
-    expected = _normalize_text(df.iloc[index, 4]) if df.shape[1] > 4 else ""
+def is_title_row(col_a: Sequence[Any], col_e: Sequence[Any], index: int) -> bool:
+    title = _normalize_text(col_a[index])
+    expected = _normalize_text(col_e[index])
     if not title:
         return False
-    if any(title.startswith(prefix) for prefix in SKIP_PREFIX):
+    if title.startswith(SKIP_PREFIX):
         return False
     return expected == ""
 
 
-def has_step_and_expected(df: pd.DataFrame, index: int) -> bool:
-    action = _normalize_text(df.iloc[index, 0])
-    expected = _normalize_text(df.iloc[index, 4]) if df.shape[1] > 4 else ""
+def has_step_and_expected(col_a: Sequence[Any], col_e: Sequence[Any], index: int) -> bool:
+    action = _normalize_text(col_a[index])
+    expected = _normalize_text(col_e[index])
     return bool(action) and bool(expected)
 
 
+def _classify_rows(col_a: Sequence[Any], col_e: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """一次性计算每行是否为标题行 / 步骤行，语义与 is_title_row、has_step_and_expected 一致。"""
+
+    # 每个单元格只归一化一次，再用 np.fromiter 直接生成布尔数组，绕开 pandas .str 的 NA 处理开销
+    a_text = [_normalize_text(value) for value in col_a]
+    e_text = [_normalize_text(value) for value in col_e]
+    count = len(a_text)
+    has_a = np.fromiter(map(bool, a_text), dtype=bool, count=count)
+    has_e = np.fromiter(map(bool, e_text), dtype=bool, count=count)
+    skip = np.fromiter((text.startswith(SKIP_PREFIX) for text in a_text), dtype=bool, count=count)
+
+    title_mask = has_a & ~has_e & ~skip
+    step_mask = has_a & has_e
+    return title_mask, step_mask
+
+
 def split_numbered(text: str) -> List[Tuple[int, str]]:
     source = (text or "").strip()
     if not source:
         return []
 
-    matches = list(STEP_SPLIT_RE.finditer(source))
-    if not matches:
+    # 单次扫描：只保留上一个编号及其正文起点，遇到下一个编号时输出上一段
+    parts: List[Tuple[int, str]] = []
+    prev_no = 0
+    prev_end = -1
+    for match in STEP_SPLIT_RE.finditer(source):
+        if prev_end < 0:
+            head = source[: match.start()].strip()
+            if head:
+                parts.append((1, head))
+        else:
+            chunk = source[prev_end : match.start()].strip()
+            if chunk:
+                parts.append((prev_no, chunk))
+        prev_no = int(match.group(1))
+        prev_end = match.end()
+
+    if prev_end < 0:
         lines = [ln.strip() for ln in source.splitlines() if ln.strip()]
         return [(idx + 1, ln) for idx, ln in enumerate(lines or [source])]
 
-    parts: List[Tuple[int, str]] = []
-    if matches[0].start() != 0:
-        head = source[: matches[0].start()].strip()
-        if head:
-            parts.append((1, head))
-
-    for idx, match in enumerate(matches):
-        number = int(match.group(1))
-        start = match.end()
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(source)
-        chunk = source[start:end].strip()
-        if chunk:
-            parts.append((number, chunk))
-
+    chunk = source[prev_end:].strip()
+    if chunk:
+        parts.append((prev_no, chunk))
     return parts
 
 
 def extract_title_and_keywords(title: str) -> Tuple[str, List[str]]:
-    tokens = TITLE_KEYWORD_RE.findall(title or "")
-    keywords = [token.strip() for token in tokens if token.strip()]
-    cleaned = TITLE_KEYWORD_RE.sub("", title or "").strip()
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip(" -—_/")
+    # 一次 finditer 同时收集关键词与方括号之外的片段，避免 findall + sub 两次扫描
+    source = title or ""
+    keywords: List[str] = []
+    pieces: List[str] = []
+    last = 0
+    for match in TITLE_KEYWORD_RE.finditer(source):
+        token = match.group(1).strip()
+        if token:
+            keywords.append(token)
+        pieces.append(source[last : match.start()])
+        last = match.end()
+    if not pieces:
+        cleaned = source.strip()
+    else:
+        pieces.append(source[last:])
+        cleaned = "".join(pieces).strip()
+    cleaned = _MULTISPACE_RE.sub(" ", cleaned).strip(_TITLE_STRIP)
     return cleaned, keywords
 
 
-def _ensure_min_columns(df: pd.DataFrame, count: int = 8) -> pd.DataFrame:
-    df = df.reindex(columns=range(count))
-    labels = [chr(ord("A") + idx) for idx in range(count)]
-    df.columns = labels
-    return df
+def _read_used_columns(
+    buffer: BinaryIO | BytesIO | Path, sheet: int
+) -> Tuple[List[Any], List[Any], List[Any]]:
+    """以只读模式逐行读取工作表，只收集 A/D/E 三列的单元格值，不构建 DataFrame。"""
+
+    workbook = load_workbook(buffer, read_only=True, data_only=True)
+    try:
+        worksheet = workbook.worksheets[sheet]
+        col_a: List[Any] = []
+        col_d: List[Any] = []
+        col_e: List[Any] = []
+        for row in worksheet.iter_rows(max_col=_MAX_COLUMN, values_only=True):
+            width = len(row)
+            col_a.append(row[0] if width > 0 else None)
+            col_d.append(row[3] if width > 3 else None)
+            col_e.append(row[4] if width > 4 else None)
+    finally:
+        workbook.close()
+    return col_a, col_d, col_e
 
 
 def parse_excel_cases(data: BinaryIO | BytesIO | Path, sheet: int = 0) -> Tuple[str, List[Dict[str, Any]]]:
     """Parse the uploaded Excel file and return folder name plus case payloads."""
 
     if isinstance(data, (bytes, bytearray)):
-        buffer: BytesIO | BinaryIO = BytesIO(data)
+        buffer: BytesIO | BinaryIO | Path = BytesIO(data)
+    elif isinstance(data, Path):
+        # openpyxl 可直接按路径打开，无需先整体读入内存
+        buffer = data
     else:
+        # 复用调用方的文件对象，从头读取
         buffer = data  # type: ignore[assignment]
+        if buffer.seekable():
+            buffer.seek(0)
 
-    df = pd.read_excel(buffer, sheet_name=sheet, header=None)
-    df = _ensure_min_columns(df)
+    col_a, col_d, col_e = _read_used_columns(buffer, sheet)
 
-    folder = extract_folder_name(df)
-    header = find_header_idx(df)
+    folder = extract_folder_name(col_d)
+    row_count = len(col_a)
+    header = find_header_idx(col_a)
+    title_mask, step_mask = _classify_rows(col_a, col_e)
 
-    index = (header + 1) if header is not None else 0
+    start = (header + 1) if header is not None else 0
+    # 只遍历标题行：对每个标题，用二分在步骤行下标中找到其后的第一条步骤，
+    # 若该步骤出现在下一个标题之前，则二者组成一条用例
+    title_rows = np.flatnonzero(title_mask).tolist()
+    step_rows = np.flatnonzero(step_mask).tolist()
     order = 1
     cases: List[Dict[str, Any]] = []
 
-    while index < len(df) - 1:
-        if is_title_row(df, index):
-            raw_title = _normalize_text(df.iloc[index, 0])
-            inner_index = index + 1
-
-            while inner_index < len(df) and not has_step_and_expected(df, inner_index):
-                if is_title_row(df, inner_index):
-                    break
-                inner_index += 1
-
-            if inner_index < len(df) and has_step_and_expected(df, inner_index):
-                steps_text = _normalize_text(df.iloc[inner_index, 0])
-                expected_text = _normalize_text(df.iloc[inner_index, 4])
-
-                title, keywords = extract_title_and_keywords(raw_title)
-                steps_split = split_numbered(steps_text)
-
-                steps_payload = [
-                    {
-                        "no": number,
-                        "action": action,
-                        "keyword": "",
-                        "note": "",
-                        "expected": "",
-                    }
-                    for number, action in steps_split
-                ]
-
-                cases.append(
-                    {
-                        "order": order,
-                        "folder": folder,
-                        "title": title or raw_title,
-                        "keywords": keywords,
-                        "expected_result": expected_text,
-                        "steps": steps_payload,
-                    }
-                )
-
-                order += 1
-                index = inner_index + 1
-                continue
-
-        index += 1
+    next_index = start
+    for pos, title_index in enumerate(title_rows):
+        if title_index < next_index:
+            continue
+        if title_index >= row_count - 1:
+            break
+        step_pos = bisect_right(step_rows, title_index)
+        if step_pos == len(step_rows):
+            break
+        step_index = step_rows[step_pos]
+        if pos + 1 < len(title_rows) and title_rows[pos + 1] < step_index:
+            continue
+
+        raw_title = _normalize_text(col_a[title_index])
+        steps_text = _normalize_text(col_a[step_index])
+        expected_text = _normalize_text(col_e[step_index])
+
+        title, keywords = extract_title_and_keywords(raw_title)
+        steps_split = split_numbered(steps_text)
+
+        steps_payload = [
+            {"no": number, "action": action, **_EMPTY_STEP_EXTRA}
+            for number, action in steps_split
+        ]
+
+        cases.append(
+            {
+                "order": order,
+                "folder": folder,
+                "title": title or raw_title,
+                "keywords": keywords,
+                "expected_result": expected_text,
+                "steps": steps_payload,
+            }
+        )
+
+        order += 1
+        next_index = step_index + 1
 
     return folder, cases
 
@@ -4,7 +4,7 @@ from controllers.auth_helpers import auth_required, require_system_roles
 from services.user_service import UserService
 from utils.response import json_response
 from utils.exceptions import BizError
-from constants.roles import SystemRole
+from constants.roles import SystemRole, ROLE_LABELS_ZH
 import traceback
 
 user_bp = Blueprint("users", __name__)
@@ -108,17 +108,17 @@ def list_users():
             "total": total,
             "items": [
                 {
-                    "id": u.id,
-                    "username": u.username,
-                    "role": u.role,
-                    "role_label": u.role_label,  # property (使用 ROLE_LABELS_ZH)
-                    "email": u.email,
-                    "phone": u.phone,
-                    "active": u.active,
-                    "created_at": u.created_at.isoformat() if u.created_at else None,
-                    "departments": dept_map.get(u.id, [])
+                    "id": uid,
+                    "username": username,
+                    "role": role,
+                    "role_label": ROLE_LABELS_ZH.get(role, role),
+                    "email": email,
+                    "phone": phone,
+                    "active": active,
+                    "created_at": created_at,
+                    "departments": dept_map.get(uid, [])
                 }
-                for u in items
+                for uid, username, role, email, phone, active, created_at in items
             ]
         }
     )
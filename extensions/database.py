@@ -1,4 +1,5 @@
 # extensions/database.py
+import orjson
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import MetaData
 from flask_migrate import Migrate
@@ -12,5 +13,18 @@ naming_convention = {
     "pk": "pk_%(table_name)s"
 }
 
-db = SQLAlchemy(metadata=MetaData(naming_convention=naming_convention))
+
+def _json_serializer(obj) -> str:
+    # 与 json.dumps 一致：非字符串键转为字符串
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON 列（用例步骤快照、关键字等）的读写改用 orjson，避免标准库 json 逐行解析/编码
+db = SQLAlchemy(
+    metadata=MetaData(naming_convention=naming_convention),
+    engine_options={
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
+    },
+)
 migrate = Migrate()
\ No newline at end of file
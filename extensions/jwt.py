@@ -1,5 +1,5 @@
 # extensions/jwt.py
-import time, json, base64, hmac, hashlib, uuid, os
+import time, json, base64, hmac, uuid, os, functools, weakref
 from flask import current_app
 from extensions.redis_client import get_redis
 
@@ -12,14 +12,34 @@ def _b64json(obj):
     return _b64(json.dumps(obj, separators=(",", ":")).encode())
 
 
+# 黑名单查询结果在进程内缓存的时间窗口（秒）
+_REVOKED_CACHE_SECONDS = 5
+
+# 头部固定为 HS256，模块加载时编码一次即可
+_HEADER_B64 = _b64json({"alg": "HS256", "typ": "JWT"})
+
+
+# 按 app 缓存编码后的签名密钥，避免每次签发/校验都经 current_app 代理取配置再 encode
+_SECRET_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def signing_secret() -> bytes:
+    """当前应用的 HS256 签名密钥（已编码）；也用作进程内已验签 token 缓存的键的一部分。"""
+    app = current_app._get_current_object()
+    secret = _SECRET_CACHE.get(app)
+    if secret is None:
+        secret = app.config["JWT_SECRET_KEY"].encode()
+        _SECRET_CACHE[app] = secret
+    return secret
+
+
 class TokenError(ValueError):
     pass
 
 
 def create_token(user_id: int, username: str, role: str, pwdv: int, expires_seconds: int = 8 * 3600):
-    secret = current_app.config["JWT_SECRET_KEY"].encode()
+    secret = signing_secret()
     now = int(time.time())
-    header = {"alg": "HS256", "typ": "JWT"}
     payload = {
         "sub": user_id,
         "username": username,
@@ -29,10 +49,10 @@ def create_token(user_id: int, username: str, role: str, pwdv: int, expires_seco
         "iat": now,
         "jti": uuid.uuid4().hex
     }
-    h_b = _b64json(header)
+    h_b = _HEADER_B64
     p_b = _b64json(payload)
     signing = h_b + b"." + p_b
-    sig = _b64(hmac.new(secret, signing, hashlib.sha256).digest())
+    sig = _b64(hmac.digest(secret, signing, "sha256"))
     return (signing + b"." + sig).decode()
 
 
@@ -42,11 +62,11 @@ def _decode_segment(seg: str):
 
 
 def decode_token(token: str, check_revoked: bool = True):
-    secret = current_app.config["JWT_SECRET_KEY"].encode()
+    secret = signing_secret()
     try:
         h_b, p_b, sig_b = token.split(".")
         signing = f"{h_b}.{p_b}".encode()
-        expected = _b64(hmac.new(secret, signing, hashlib.sha256).digest()).decode()
+        expected = _b64(hmac.digest(secret, signing, "sha256")).decode()
         if not hmac.compare_digest(expected, sig_b):
             raise TokenError("签名不匹配")
 
@@ -83,8 +103,16 @@ def revoke_token(token: str):
     ttl = max(exp - now, 1)
     r = get_redis()
     r.setex(f"jwt:blk:{jti}", ttl, "1")
+    # 本进程立即生效；其他进程最多延迟一个缓存窗口
+    _is_revoked_in_bucket.cache_clear()
 
 
-def is_token_revoked(jti: str) -> bool:
+@functools.lru_cache(maxsize=4096)
+def _is_revoked_in_bucket(jti: str, bucket: int) -> bool:
     r = get_redis()
-    return bool(r.get(f"jwt:blk:{jti}"))
+    return bool(r.exists(f"jwt:blk:{jti}"))
+
+
+def is_token_revoked(jti: str) -> bool:
+    # 以时间分桶作为缓存键的一部分，桶切换后自然重新查询 Redis
+    return _is_revoked_in_bucket(jti, int(time.time()) // _REVOKED_CACHE_SECONDS)
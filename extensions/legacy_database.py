@@ -4,9 +4,12 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Generator, Optional
 
+from flask import g, has_app_context
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine, Connection
 
+_G_CONNECTION_KEY = "_legacy_conn"
+
 
 class LegacyDatabase:
     """Light-weight SQLAlchemy engine wrapper for the legacy MySQL database."""
@@ -19,23 +22,57 @@ class LegacyDatabase:
         if not uri:
             app.logger.warning("LEGACY_DATABASE_URI is not configured; legacy data APIs are disabled.")
             return
-        self._engine = create_engine(uri, pool_pre_ping=True)
+        self._engine = create_engine(
+            uri,
+            pool_pre_ping=True,
+            pool_size=app.config.get("LEGACY_DB_POOL_SIZE", 20),
+            max_overflow=app.config.get("LEGACY_DB_MAX_OVERFLOW", 40),
+            pool_recycle=app.config.get("LEGACY_DB_POOL_RECYCLE", 1800),
+        )
+        app.teardown_appcontext(self._close_context_connection)
 
     @contextmanager
     def connect(self) -> Generator[Connection, None, None]:
+        """Yield a connection.
+
+        Inside an application context the connection is checked out once and
+        reused by every call until teardown, so a request pays the pool
+        checkout and pre-ping only once. Outside a context (scripts, background
+        jobs) a fresh connection is opened and closed per call.
+        """
         if not self._engine:
             raise RuntimeError("Legacy database engine is not initialized")
-        connection = self._engine.connect()
+
+        if not has_app_context():
+            connection = self._engine.connect()
+            try:
+                yield connection
+            finally:
+                connection.close()
+            return
+
+        connection = g.get(_G_CONNECTION_KEY)
+        if connection is None or connection.closed:
+            connection = self._engine.connect()
+            setattr(g, _G_CONNECTION_KEY, connection)
         try:
             yield connection
-        finally:
-            connection.close()
+        except Exception:
+            # 出错后回滚，避免同一请求内后续查询沿用失效的事务
+            connection.rollback()
+            raise
 
     def get_engine(self) -> Engine:
         if not self._engine:
             raise RuntimeError("Legacy database engine is not initialized")
         return self._engine
 
+    @staticmethod
+    def _close_context_connection(exc: Optional[BaseException] = None) -> None:
+        connection = g.pop(_G_CONNECTION_KEY, None)
+        if connection is not None:
+            connection.close()
+
 
 legacy_db = LegacyDatabase()
 
@@ -1,10 +1,26 @@
 # extensions/logger.py
-import os, sys, logging, json, uuid, time
+import os, sys, logging, time, itertools
+import orjson
 from logging.handlers import RotatingFileHandler
 from flask import g, request
 from werkzeug.exceptions import HTTPException
 
 _REQUEST_ID_KEY = "request_id"
+# REQ/RESP 日志通过 extra 传入的结构化字段，JSON 格式下原样输出
+_STRUCTURED_FIELDS = ("method", "path", "remote", "status", "duration_ms")
+
+
+def _reset_request_id_seed():
+    # 进程级随机前缀 + 自增计数生成请求 ID，避免每个请求都读取 os.urandom；
+    # fork 出的子进程重新取前缀，保证多 worker 之间不重复
+    global _REQUEST_ID_PREFIX, _REQUEST_ID_COUNTER
+    _REQUEST_ID_PREFIX = os.urandom(4).hex()
+    _REQUEST_ID_COUNTER = itertools.count(1)
+
+
+_reset_request_id_seed()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_id_seed)
 
 
 class JsonFormatter(logging.Formatter):
@@ -19,9 +35,13 @@ class JsonFormatter(logging.Formatter):
             data["request_id"] = record.request_id
         if hasattr(record, "user_id"):
             data["user_id"] = record.user_id
+        fields = record.__dict__
+        for key in _STRUCTURED_FIELDS:
+            if key in fields:
+                data[key] = fields[key]
         if record.exc_info:
             data["exc"] = self.formatException(record.exc_info)
-        return json.dumps(data, ensure_ascii=False)
+        return orjson.dumps(data, default=str).decode()
 
 
 class RequestIdFilter(logging.Filter):
@@ -36,7 +56,7 @@ class RequestIdFilter(logging.Filter):
 
 def _ensure_request_id():
     if not hasattr(g, _REQUEST_ID_KEY):
-        setattr(g, _REQUEST_ID_KEY, uuid.uuid4().hex)
+        setattr(g, _REQUEST_ID_KEY, f"{_REQUEST_ID_PREFIX}{next(_REQUEST_ID_COUNTER):x}")
     return getattr(g, _REQUEST_ID_KEY)
 
 
@@ -92,12 +112,20 @@ def init_logger(app):
     def _before():
         g._req_start = time.time()
         _ensure_request_id()
-        app.logger.info(f"REQ {request.method} {request.path} from {request.remote_addr}")
+        method, path, remote = request.method, request.path, request.remote_addr
+        app.logger.info(
+            "REQ %s %s from %s", method, path, remote,
+            extra={"method": method, "path": path, "remote": remote},
+        )
 
     @app.after_request
     def _after(resp):
         duration = (time.time() - getattr(g, "_req_start", time.time())) * 1000
-        app.logger.info(f"RESP {request.method} {request.path} {resp.status_code} {duration:.1f}ms")
+        method, path, status = request.method, request.path, resp.status_code
+        app.logger.info(
+            "RESP %s %s %s %.1fms", method, path, status, duration,
+            extra={"method": method, "path": path, "status": status, "duration_ms": round(duration, 1)},
+        )
         return resp
 
     @app.errorhandler(Exception)
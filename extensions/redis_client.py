@@ -1,13 +1,43 @@
 # extensions/redis_client.py
 import os
-import redis
+import threading
 
 _redis_client = None
+_lock = threading.Lock()
+
 
 def get_redis():
     global _redis_client
     if _redis_client is not None:
         return _redis_client
-    url = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
-    _redis_client = redis.from_url(url)
+    # 双重检查加锁，避免多线程并发首次访问时各自创建客户端
+    with _lock:
+        if _redis_client is None:
+            # 延迟导入：迁移、flask shell 等不访问 Redis 的入口无需加载 redis 包
+            import redis
+
+            url = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
+            # from_url 会把连接参数交给其内部的 ConnectionPool，所有调用方共享同一个有界连接池
+            _redis_client = redis.from_url(
+                url,
+                max_connections=int(os.getenv("REDIS_POOL_MAX", "64")),
+                socket_keepalive=True,
+                health_check_interval=30,
+            )
     return _redis_client
+
+
+def redis_error():
+    """redis 客户端异常基类（连接、超时等均为其子类），用于 except 子句；延迟导入理由同上。"""
+    from redis import RedisError
+
+    return RedisError
+
+
+def close_redis():
+    """关闭客户端并断开连接池（用于进程优雅退出）。"""
+    global _redis_client
+    with _lock:
+        if _redis_client is not None:
+            _redis_client.close()
+            _redis_client = None
@@ -1,18 +1,75 @@
 # middlewares/auth.py
 import functools
+import threading
+import time
+from collections import OrderedDict
 from flask import request, g
-from extensions.jwt import decode_token, TokenError
+from extensions.jwt import decode_token, is_token_revoked, TokenError, signing_secret
 from utils.response import json_response
 
+# 已验签 token 的进程内缓存：(密钥, token) -> payload。
+# 同一 token 在有效期内反复请求时省去 base64/json 解析与 HMAC 验签；
+# 过期时间与黑名单在每次命中时仍会重新判断（黑名单查询本身有短时缓存）。
+_TOKEN_CACHE_MAX = 4096
+_token_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _cached_payload(key):
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+        if payload is not None:
+            _token_cache.move_to_end(key)
+        return payload
+
+
+def _remember_payload(key, payload):
+    with _token_cache_lock:
+        _token_cache[key] = payload
+        _token_cache.move_to_end(key)
+        if len(_token_cache) > _TOKEN_CACHE_MAX:
+            _token_cache.popitem(last=False)
+
+
+def _forget_payload(key):
+    with _token_cache_lock:
+        _token_cache.pop(key, None)
+
+
+def decode_token_cached(token: str) -> dict:
+    """
+    与 decode_token 语义一致（含过期与黑名单校验），命中缓存时跳过验签。
+    返回 payload 的副本：调用方（如 g.jwt_payload）修改返回值不会污染缓存。
+    """
+    key = (signing_secret(), token)
+    payload = _cached_payload(key)
+    if payload is None:
+        payload = decode_token(token)
+        # 没有 exp 的 token 无法自然淘汰，不进缓存
+        if payload.get("exp"):
+            _remember_payload(key, payload)
+        return dict(payload)
+
+    if time.time() > payload["exp"]:
+        _forget_payload(key)
+        raise TokenError("token已过期")
+    jti = payload.get("jti")
+    if jti and is_token_revoked(jti):
+        _forget_payload(key)
+        raise TokenError("token已失效")
+    return dict(payload)
+
+
 def login_required(fn):
     @functools.wraps(fn)
     def _wrap(*args, **kwargs):
         auth = request.headers.get("Authorization", "")
         if not auth.startswith("Bearer "):
             return json_response(code=401, message="未授权")
-        token = auth.split(" ", 1)[1].strip()
+        # 前缀已校验，直接切片取 token，省去 split 生成的中间列表
+        token = auth[7:].strip()
         try:
-            payload = decode_token(token)
+            payload = decode_token_cached(token)
         except TokenError as e:
             return json_response(code=401, message=str(e))
         g.current_user_id = payload.get("sub")
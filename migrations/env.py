@@ -5,6 +5,8 @@ from flask import current_app
 
 from alembic import context
 
+import models
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -37,6 +39,8 @@ def get_engine_url():
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
 config.set_main_option('sqlalchemy.url', get_engine_url())
+# 确保所有模型都已注册到元数据，autogenerate 才能检测到全部表
+models.load_all()
 target_db = current_app.extensions['migrate'].db
 
 # other values from the config, defined by the needs of env.py,
@@ -0,0 +1,28 @@
+"""execution_result covering index for run dashboards
+
+Revision ID: 3f1c2a7d9e04
+Revises: 59c6bc626549
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a7d9e04'
+down_revision = '59c6bc626549'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('execution_result', schema=None) as batch_op:
+        batch_op.create_index('ix_er_run_result_case', ['run_id', 'result', 'plan_case_id'], unique=False)
+        batch_op.drop_index('ix_execution_result_run_status')
+
+
+def downgrade():
+    with op.batch_alter_table('execution_result', schema=None) as batch_op:
+        batch_op.create_index('ix_execution_result_run_status', ['run_id', 'result'], unique=False)
+        batch_op.drop_index('ix_er_run_result_case')
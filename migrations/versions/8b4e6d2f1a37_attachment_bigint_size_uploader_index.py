@@ -0,0 +1,34 @@
+"""attachment bigint size and uploader index
+
+Revision ID: 8b4e6d2f1a37
+Revises: 3f1c2a7d9e04
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4e6d2f1a37'
+down_revision = '3f1c2a7d9e04'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('attachment', schema=None) as batch_op:
+        batch_op.alter_column('size',
+               existing_type=sa.Integer(),
+               type_=sa.BigInteger(),
+               existing_nullable=True)
+        batch_op.create_index('ix_attachment_uploader_created', ['uploaded_by', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('attachment', schema=None) as batch_op:
+        batch_op.drop_index('ix_attachment_uploader_created')
+        batch_op.alter_column('size',
+               existing_type=sa.BigInteger(),
+               type_=sa.Integer(),
+               existing_nullable=True)
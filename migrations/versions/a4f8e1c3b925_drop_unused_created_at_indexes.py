@@ -0,0 +1,38 @@
+"""drop created_at indexes on append-heavy tables
+
+Revision ID: a4f8e1c3b925
+Revises: e2a7c4f9d816
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4f8e1c3b925'
+down_revision = 'e2a7c4f9d816'
+branch_labels = None
+depends_on = None
+
+# 设置了 __index_created_at__ = False 的表：不按创建时间查询，只在写入时维护索引
+UNINDEXED_CREATED_AT_TABLES = (
+    'execution_run',
+    'execution_result',
+    'execution_result_log',
+    'plan_case',
+    'plan_device_model',
+    'user_password_history',
+)
+
+
+def upgrade():
+    for table in UNINDEXED_CREATED_AT_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(batch_op.f(f'ix_{table}_created_at'))
+
+
+def downgrade():
+    for table in UNINDEXED_CREATED_AT_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(batch_op.f(f'ix_{table}_created_at'), ['created_at'], unique=False)
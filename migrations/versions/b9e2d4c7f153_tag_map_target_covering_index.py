@@ -0,0 +1,28 @@
+"""tag_map target index covers tag_id
+
+Revision ID: b9e2d4c7f153
+Revises: d7b3f5a2c618
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9e2d4c7f153'
+down_revision = 'd7b3f5a2c618'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tag_map', schema=None) as batch_op:
+        batch_op.drop_index('ix_tag_map_target')
+        batch_op.create_index('ix_tag_map_target', ['target_type', 'target_id', 'tag_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tag_map', schema=None) as batch_op:
+        batch_op.drop_index('ix_tag_map_target')
+        batch_op.create_index('ix_tag_map_target', ['target_type', 'target_id'], unique=False)
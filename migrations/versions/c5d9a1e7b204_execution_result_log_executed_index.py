@@ -0,0 +1,28 @@
+"""execution_result_log index ordered by executed_at
+
+Revision ID: c5d9a1e7b204
+Revises: 8b4e6d2f1a37
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d9a1e7b204'
+down_revision = '8b4e6d2f1a37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('execution_result_log', schema=None) as batch_op:
+        batch_op.create_index('ix_execution_result_log_result_executed', ['execution_result_id', 'executed_at'], unique=False)
+        batch_op.drop_index('ix_execution_result_log_result')
+
+
+def downgrade():
+    with op.batch_alter_table('execution_result_log', schema=None) as batch_op:
+        batch_op.create_index('ix_execution_result_log_result', ['execution_result_id', 'created_at'], unique=False)
+        batch_op.drop_index('ix_execution_result_log_result_executed')
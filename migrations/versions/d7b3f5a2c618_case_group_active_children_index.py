@@ -0,0 +1,32 @@
+"""case_group children index covers soft delete and sort order
+
+Revision ID: d7b3f5a2c618
+Revises: a4f8e1c3b925
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7b3f5a2c618'
+down_revision = 'a4f8e1c3b925'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('case_group', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_case_group_dept_parent_active',
+            ['department_id', 'parent_id', 'is_deleted', 'order_no'],
+            unique=False,
+        )
+        batch_op.drop_index('ix_case_group_dept_parent')
+
+
+def downgrade():
+    with op.batch_alter_table('case_group', schema=None) as batch_op:
+        batch_op.create_index('ix_case_group_dept_parent', ['department_id', 'parent_id'], unique=False)
+        batch_op.drop_index('ix_case_group_dept_parent_active')
@@ -0,0 +1,58 @@
+"""drop single-column updated_at indexes
+
+Revision ID: e2a7c4f9d816
+Revises: c5d9a1e7b204
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a7c4f9d816'
+down_revision = 'c5d9a1e7b204'
+branch_labels = None
+depends_on = None
+
+# 使用 TimestampMixin 的全部表；updated_at 不再建单列索引
+TIMESTAMPED_TABLES = (
+    'attachment',
+    'case_group',
+    'comment',
+    'department',
+    'department_member',
+    'device_model',
+    'execution_result',
+    'execution_result_log',
+    'execution_run',
+    'plan_case',
+    'plan_device_model',
+    'project',
+    'project_member',
+    'tag',
+    'tag_map',
+    'test_case',
+    'test_plan',
+    'test_plan_tester',
+    'user',
+    'user_password_history',
+)
+
+
+def upgrade():
+    with op.batch_alter_table('test_case', schema=None) as batch_op:
+        batch_op.create_index('ix_test_case_dept_updated', ['department_id', 'updated_at'], unique=False)
+
+    for table in TIMESTAMPED_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(batch_op.f(f'ix_{table}_updated_at'))
+
+
+def downgrade():
+    for table in TIMESTAMPED_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(batch_op.f(f'ix_{table}_updated_at'), ['updated_at'], unique=False)
+
+    with op.batch_alter_table('test_case', schema=None) as batch_op:
+        batch_op.drop_index('ix_test_case_dept_updated')
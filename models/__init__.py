@@ -2,45 +2,64 @@
 """
 __init__.py
 --------------------------------------------------------------------
-汇总导入所有模型，使得：
-- Flask-Migrate/Alembic 自动检测模型。
+按需导出所有模型，使得：
 - 外部模块可简化引用：from models import TestCase, ExecutionRun
+- 只用到个别模型的脚本不必加载全部模型模块（PEP 562 模块级 __getattr__）。
 注意：
-- 避免循环导入：各模型仅在这里集中 import。
-- 若模型特别多，可分批导入或动态发现（当前规模够用）。
+- 关系使用字符串引用其他模型，映射配置前必须注册全部模型：
+  create_app 与 migrations/env.py 会调用 load_all()，保证 Flask-Migrate/Alembic 能检测到所有表。
+- 新增模型时需要同步登记到 _LAZY。
 """
 
-from .mixins import TimestampMixin
-from .user import User
-from .department import Department, DepartmentMember
-from .project import Project, ProjectMember
-from .device_model import DeviceModel
-from .case_group import CaseGroup
-from .test_case_history import TestCaseHistory
-from .test_case import TestCase
-from .test_plan import TestPlan
-from .plan_case import PlanCase
-from .plan_device_model import PlanDeviceModel
-from .plan_tester import TestPlanTester
-from .execution import (
-    ExecutionRun,
-    ExecutionResult,
-    ExecutionResultLog,
-    EXECUTION_RESULT_ATTACHMENT_TYPE,
-    EXECUTION_RESULT_LOG_ATTACHMENT_TYPE,
-)
-from .comment import Comment
-from .attachment import Attachment
-from .tag import Tag, TagMap
-from .user_password_history import UserPasswordHistory
-
-all = [
-    "TimestampMixin",
-    "User", "Department", "DepartmentMember", "Project", "ProjectMember",
-    "DeviceModel", "CaseGroup", "TestCaseHistory", "TestCase", "TestPlan",
-    "PlanCase", "PlanDeviceModel", "TestPlanTester", "ExecutionRun", "ExecutionResult",
-    "ExecutionResultLog",
-    "EXECUTION_RESULT_ATTACHMENT_TYPE",
-    "EXECUTION_RESULT_LOG_ATTACHMENT_TYPE",
-    "Comment", "Attachment", "Tag", "TagMap", "UserPasswordHistory"
-]
+import importlib
+import sys
+
+# 导出名 -> 所在子模块
+_LAZY = {
+    "TimestampMixin": ".mixins",
+    "User": ".user",
+    "Department": ".department",
+    "DepartmentMember": ".department",
+    "Project": ".project",
+    "ProjectMember": ".project",
+    "DeviceModel": ".device_model",
+    "CaseGroup": ".case_group",
+    "TestCaseHistory": ".test_case_history",
+    "TestCase": ".test_case",
+    "TestPlan": ".test_plan",
+    "PlanCase": ".plan_case",
+    "PlanDeviceModel": ".plan_device_model",
+    "TestPlanTester": ".plan_tester",
+    "ExecutionRun": ".execution",
+    "ExecutionResult": ".execution",
+    "ExecutionResultLog": ".execution",
+    "EXECUTION_RESULT_ATTACHMENT_TYPE": ".execution",
+    "EXECUTION_RESULT_LOG_ATTACHMENT_TYPE": ".execution",
+    "Comment": ".comment",
+    "Attachment": ".attachment",
+    "Tag": ".tag",
+    "TagMap": ".tag",
+    "UserPasswordHistory": ".user_password_history",
+}
+
+__all__ = list(_LAZY) + ["load_all"]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def load_all():
+    """导入全部模型模块，注册所有映射类与表结构。"""
+    module = sys.modules[__name__]
+    for name in _LAZY:
+        getattr(module, name)
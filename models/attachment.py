@@ -21,6 +21,7 @@ class Attachment(TimestampMixin, db.Model):
     __tablename__ = "attachment"
     __table_args__ = (
         db.Index("ix_attachment_target", "target_type", "target_id"),
+        db.Index("ix_attachment_uploader_created", "uploaded_by", "created_at"),
         COMMON_TABLE_ARGS,
     )
 
@@ -31,10 +32,10 @@ class Attachment(TimestampMixin, db.Model):
     stored_file_name = db.Column(db.String(255), nullable=False)
     file_path = db.Column(db.String(512), nullable=False)
     mime_type = db.Column(db.String(128))
-    size = db.Column(db.Integer)
+    size = db.Column(db.BigInteger)  # 字节数，INT 上限约 2GiB
     uploaded_by = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"))
 
-    uploader = db.relationship("User", backref=db.backref("attachments", passive_deletes=True))
+    uploader = db.relationship("User")
 
     def to_dict(self):
         return {
@@ -47,6 +48,6 @@ class Attachment(TimestampMixin, db.Model):
             "mime_type": self.mime_type,
             "size": self.size,
             "uploaded_by": self.uploaded_by,
-            "uploaded_at": self.created_at.isoformat() if self.created_at else None,
+            "uploaded_at": self.created_at,
         }
 
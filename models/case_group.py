@@ -16,7 +16,9 @@ from .mixins import TimestampMixin, SoftDeleteMixin, COMMON_TABLE_ARGS
 class CaseGroup(TimestampMixin, SoftDeleteMixin, db.Model):
     __tablename__ = "case_group"
     __table_args__ = (
-        db.Index("ix_case_group_dept_parent", "department_id", "parent_id"),
+        # 子分组列表按 (department_id, parent_id, is_deleted=0) 过滤、按 order_no, id 排序；
+        # InnoDB 二级索引隐含主键 id，过滤与排序都由该索引完成。MySQL 不支持部分索引，is_deleted 作为索引列
+        db.Index("ix_case_group_dept_parent_active", "department_id", "parent_id", "is_deleted", "order_no"),
         db.Index("ix_case_group_path", "department_id", "path"),
         COMMON_TABLE_ARGS,
     )
@@ -40,14 +42,20 @@ class CaseGroup(TimestampMixin, SoftDeleteMixin, db.Model):
     updated_by = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="SET NULL"))
 
     # 关系
-    department = db.relationship("Department", backref=db.backref("case_groups", lazy="dynamic"))
+    # 集合关系使用普通懒加载列表（而非 lazy="dynamic"），需要时可在查询处 selectinload 批量加载；
+    # 数据库外键已 ON DELETE CASCADE，passive_deletes 避免删除时先加载整个集合
+    department = db.relationship("Department", back_populates="case_groups")
     parent = db.relationship(
         "CaseGroup",
         remote_side=[id],
-        backref=db.backref("children", lazy="dynamic")
+        back_populates="children"
+    )
+    children = db.relationship(
+        "CaseGroup",
+        back_populates="parent",
+        passive_deletes=True
     )
     test_cases = db.relationship(
         "TestCase",
-        back_populates="group",
-        lazy="dynamic"
+        back_populates="group"
     )
@@ -29,4 +29,4 @@ class Comment(TimestampMixin, db.Model):
     target_id = db.Column(db.Integer, nullable=False)
     content = db.Column(db.Text, nullable=False)
 
-    author = db.relationship("User", backref=db.backref("comments", passive_deletes=True))
\ No newline at end of file
+    author = db.relationship("User")
\ No newline at end of file
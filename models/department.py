@@ -30,6 +30,7 @@ class Department(TimestampMixin, db.Model):
     projects = db.relationship("Project", back_populates="department", cascade="all, delete-orphan")
     test_cases = db.relationship("TestCase", back_populates="department", cascade="all, delete-orphan")
     device_models = db.relationship("DeviceModel", back_populates="department")
+    case_groups = db.relationship("CaseGroup", back_populates="department", passive_deletes=True)
 
     def to_dict(self, counts_data=None):
         """优化的to_dict方法，接受预计算的计数数据"""
@@ -39,8 +40,8 @@ class Department(TimestampMixin, db.Model):
             "code": self.code,
             "active": self.active,
             "description": self.description,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
         if counts_data and self.id in counts_data:
@@ -61,7 +62,8 @@ class DepartmentMember(TimestampMixin, db.Model):
     role = db.Column(db.String(32), nullable=False, server_default=DepartmentRole.VIEWER.value)
 
     department = db.relationship("Department", back_populates="members")
-    user = db.relationship("User", backref=db.backref("department_memberships", cascade="all, delete-orphan"))
+    # 单向关系：User 侧不挂成员集合，删除用户时由外键 ON DELETE CASCADE 清理成员记录
+    user = db.relationship("User")
 
     def to_dict(self, user_basic: bool = False):
         data = {
@@ -69,8 +71,8 @@ class DepartmentMember(TimestampMixin, db.Model):
             "department_id": self.department_id,
             "user_id": self.user_id,
             "role": self.role,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
         if user_basic and self.user:
             data["user"] = {
@@ -53,6 +53,6 @@ class DeviceModel(TimestampMixin, db.Model):
             "description": self.description,
             "attributes_json": self.attributes_json,
             "active": bool(self.active),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
@@ -33,6 +33,7 @@ EXECUTION_RESULT_LOG_ATTACHMENT_TYPE = "execution_result_log"
 
 class ExecutionRun(TimestampMixin, db.Model):
     __tablename__ = "execution_run"
+    __index_created_at__ = False
     __table_args__ = (
         db.Index("ix_execution_run_plan_status", "plan_id", "status"),
         COMMON_TABLE_ARGS,
@@ -57,8 +58,10 @@ class ExecutionRun(TimestampMixin, db.Model):
     not_run = db.Column(db.Integer, nullable=False, server_default="0")
 
     test_plan = db.relationship("TestPlan", back_populates="execution_runs")
-    trigger_user = db.relationship("User", backref=db.backref("execution_runs", passive_deletes=True))
-    execution_results = db.relationship("ExecutionResult", back_populates="execution_run", cascade="all, delete-orphan")
+    trigger_user = db.relationship("User")
+    execution_results = db.relationship(
+        "ExecutionResult", back_populates="execution_run", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def to_dict(self, include_results: bool = False):
         data = {
@@ -85,9 +88,11 @@ class ExecutionRun(TimestampMixin, db.Model):
 
 class ExecutionResult(TimestampMixin, db.Model):
     __tablename__ = "execution_result"
+    __index_created_at__ = False
     __table_args__ = (
         db.UniqueConstraint("run_id", "plan_case_id", "device_model_id", name="uq_execution_result_run_case_device"),
-        db.Index("ix_execution_result_run_status", "run_id", "result"),
+        # 覆盖看板按 run 统计/按结果回查用例的查询；(run_id, result) 为其前缀，无需单独建索引
+        db.Index("ix_er_run_result_case", "run_id", "result", "plan_case_id"),
         COMMON_TABLE_ARGS,
     )
 
@@ -110,11 +115,12 @@ class ExecutionResult(TimestampMixin, db.Model):
     plan_case = db.relationship("PlanCase", back_populates="execution_results")
     device_model = db.relationship("DeviceModel", back_populates="execution_results")
     plan_device_model = db.relationship("PlanDeviceModel", back_populates="execution_results")
-    executor = db.relationship("User", backref=db.backref("execution_results", passive_deletes=True))
+    executor = db.relationship("User")
     logs = db.relationship(
         "ExecutionResultLog",
         back_populates="execution_result",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="ExecutionResultLog.executed_at.desc()",
     )
     attachments = db.relationship(
@@ -137,39 +143,34 @@ class ExecutionResult(TimestampMixin, db.Model):
         device_category = None
         device_payload = None
 
-        if self.plan_device_model:
-            device_name = self.plan_device_model.snapshot_name or (
-                self.plan_device_model.device_model.name
-                if self.plan_device_model.device_model
-                else None
-            )
-            device_model_code = self.plan_device_model.snapshot_model_code or (
-                self.plan_device_model.device_model.model_code
-                if self.plan_device_model.device_model
-                else None
-            )
-            device_category = self.plan_device_model.snapshot_category or (
-                self.plan_device_model.device_model.category
-                if self.plan_device_model.device_model
-                else None
-            )
-            device_payload = self.plan_device_model.to_dict()
-        elif self.device_model:
-            device_name = self.device_model.name
-            device_model_code = self.device_model.model_code
-            device_category = self.device_model.category
-            device_payload = {
-                "id": self.device_model_id,
-                "name": device_name,
-                "model_code": device_model_code,
-                "category": device_category,
-            }
+        plan_device_model = self.plan_device_model
+        if plan_device_model:
+            # 快照回退逻辑由 PlanDeviceModel.to_dict 统一处理，这里直接复用其结果
+            device_payload = plan_device_model.to_dict()
+            device_name = device_payload["name"]
+            device_model_code = device_payload["model_code"]
+            device_category = device_payload["category"]
+        else:
+            # 关系属性走 ORM 描述符，每个只读取一次
+            device_model = self.device_model
+            if device_model:
+                device_name = device_model.name
+                device_model_code = device_model.model_code
+                device_category = device_model.category
+                device_payload = {
+                    "id": self.device_model_id,
+                    "name": device_name,
+                    "model_code": device_model_code,
+                    "category": device_category,
+                }
 
-        executor_name = self.executor.username if self.executor else None
+        executor = self.executor
+        executed_by = self.executed_by
+        executor_name = executor.username if executor else None
         executor_payload = None
-        if self.executor or self.executed_by is not None:
+        if executor or executed_by is not None:
             executor_payload = {
-                "id": self.executed_by,
+                "id": executed_by,
                 "username": executor_name,
             }
 
@@ -180,7 +181,7 @@ class ExecutionResult(TimestampMixin, db.Model):
             "device_model_id": self.device_model_id,
             "plan_device_model_id": self.plan_device_model_id,
             "result": self.result,
-            "executed_by": self.executed_by,
+            "executed_by": executed_by,
             "executed_by_name": executor_name,
             "executor": executor_payload,
             "executed_at": datetime_to_beijing_iso(self.executed_at),
@@ -207,8 +208,10 @@ class ExecutionResult(TimestampMixin, db.Model):
 
 class ExecutionResultLog(TimestampMixin, db.Model):
     __tablename__ = "execution_result_log"
+    __index_created_at__ = False
     __table_args__ = (
-        db.Index("ix_execution_result_log_result", "execution_result_id", "created_at"),
+        # 与 ExecutionResult.logs 的 order_by(executed_at DESC) 对齐，按结果取历史时免 filesort
+        db.Index("ix_execution_result_log_result_executed", "execution_result_id", "executed_at"),
         COMMON_TABLE_ARGS,
     )
 
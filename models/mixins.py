@@ -1,5 +1,6 @@
 # models/mixins.py
 from sqlalchemy import func, DateTime
+from sqlalchemy.orm import declared_attr
 from datetime import datetime
 from extensions.database import db
 
@@ -11,8 +12,19 @@ COMMON_TABLE_ARGS = {
 
 
 class TimestampMixin:
-    created_at = db.Column(DateTime, nullable=False, server_default=func.now(), index=True)
-    updated_at = db.Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), index=True)
+    # 默认为 created_at 建单列索引（列表按创建时间排序）；
+    # 从不按创建时间查询的高频写入表设置 __index_created_at__ = False 省掉这棵索引
+    __index_created_at__ = True
+
+    @declared_attr
+    def created_at(cls):
+        return db.Column(
+            DateTime, nullable=False, server_default=func.now(), index=cls.__index_created_at__
+        )
+
+    # updated_at 每次 UPDATE 都会变化，不建全局单列索引以免放大写入；
+    # 确有按更新时间查询/排序的表在自身 __table_args__ 中建组合索引
+    updated_at = db.Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
 
 
 class SoftDeleteMixin:
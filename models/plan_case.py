@@ -17,9 +17,12 @@ from extensions.database import db
 from .mixins import TimestampMixin, COMMON_TABLE_ARGS
 from constants.test_plan import ExecutionResultStatus
 
+_PENDING = ExecutionResultStatus.PENDING.value
+
 
 class PlanCase(TimestampMixin, db.Model):
     __tablename__ = "plan_case"
+    __index_created_at__ = False
     __table_args__ = (
         db.UniqueConstraint("plan_id", "case_id", name="uq_plan_case_plan_case"),
         db.Index("ix_plan_case_plan_priority", "plan_id", "snapshot_priority"),
@@ -56,16 +59,11 @@ class PlanCase(TimestampMixin, db.Model):
     # 关系
     test_plan = db.relationship("TestPlan", back_populates="plan_cases")
     origin_case = db.relationship("TestCase", back_populates="plan_cases")
-    execution_results = db.relationship("ExecutionResult", back_populates="plan_case")
+    # 外键 ON DELETE CASCADE，删除用例快照时不加载结果去置空外键
+    execution_results = db.relationship("ExecutionResult", back_populates="plan_case", passive_deletes=True)
 
-    def to_dict(
-        self,
-        *,
-        include_results: bool = True,
-        include_result_details: bool = True,
-        device_model_id: Optional[int] = None,
-    ):
-        data = {
+    def _base_payload(self) -> dict:
+        return {
             "id": self.id,
             "plan_id": self.plan_id,
             "case_id": self.case_id,
@@ -82,38 +80,50 @@ class PlanCase(TimestampMixin, db.Model):
             "keywords": list(self.origin_case.keywords or []) if self.origin_case else [],
         }
 
-        latest = ExecutionResultStatus.PENDING.value
+    def _results_for_device(self, device_model_id: Optional[int]):
+        """按机型筛选执行结果；未绑定机型（device_model_id 为空）的结果对所有机型可见。"""
+        if device_model_id is None:
+            return self.execution_results
+        return [
+            result
+            for result in self.execution_results
+            if result.device_model_id in (device_model_id, None)
+        ]
+
+    @staticmethod
+    def _latest_result(results) -> str:
+        """取最近一次非 pending 结果（按 executed_at，缺省时用 updated_at）；全部未执行时为 pending。"""
+        latest = _PENDING
         latest_at = None
-        results_source = list(self.execution_results)
-        if device_model_id is not None:
-            results_source = [
-                result
-                for result in results_source
-                if result.device_model_id == device_model_id
-                or result.device_model_id is None
-            ]
+        for result in results:
+            if result.result != _PENDING:
+                ts = result.executed_at or result.updated_at
+                if not latest_at or (ts and ts > latest_at):
+                    latest = result.result
+                    latest_at = ts
+        return latest
 
+    def to_dict(
+        self,
+        *,
+        include_results: bool = True,
+        include_result_details: bool = True,
+        device_model_id: Optional[int] = None,
+    ):
+        data = self._base_payload()
+
+        latest = _PENDING
+        results_source = self._results_for_device(device_model_id)
         if include_results:
-            results = []
-            for result in results_source:
-                results.append(
-                    result.to_dict(
-                        include_attachments=include_result_details,
-                        include_history=include_result_details,
-                    )
+            data["execution_results"] = [
+                result.to_dict(
+                    include_attachments=include_result_details,
+                    include_history=include_result_details,
                 )
-                if result.result != ExecutionResultStatus.PENDING.value:
-                    ts = result.executed_at or result.updated_at
-                    if not latest_at or (ts and ts > latest_at):
-                        latest = result.result
-                        latest_at = ts
-            data["execution_results"] = results
+                for result in results_source
+            ]
+            latest = self._latest_result(results_source)
         elif device_model_id is not None:
-            for result in results_source:
-                if result.result != ExecutionResultStatus.PENDING.value:
-                    ts = result.executed_at or result.updated_at
-                    if not latest_at or (ts and ts > latest_at):
-                        latest = result.result
-                        latest_at = ts
+            latest = self._latest_result(results_source)
         data["latest_result"] = latest
         return data
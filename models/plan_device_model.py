@@ -13,6 +13,7 @@ from .mixins import TimestampMixin, COMMON_TABLE_ARGS
 
 class PlanDeviceModel(TimestampMixin, db.Model):
     __tablename__ = "plan_device_model"
+    __index_created_at__ = False
     __table_args__ = (
         db.UniqueConstraint("plan_id", "device_model_id", name="uq_plan_device_model_plan_device"),
         COMMON_TABLE_ARGS,
@@ -31,22 +32,15 @@ class PlanDeviceModel(TimestampMixin, db.Model):
 
     test_plan = db.relationship("TestPlan", back_populates="plan_device_models")
     device_model = db.relationship("DeviceModel", back_populates="plan_device_models")
-    execution_results = db.relationship("ExecutionResult", back_populates="plan_device_model")
+    # 外键 ON DELETE SET NULL，由数据库处理
+    execution_results = db.relationship("ExecutionResult", back_populates="plan_device_model", passive_deletes=True)
 
     def to_dict(self):
-        name = self.snapshot_name or (self.device_model.name if self.device_model else None)
-        model_code = self.snapshot_model_code or (
-            self.device_model.model_code if self.device_model else None
-        )
-        category = self.snapshot_category or (
-            self.device_model.category if self.device_model else None
-        )
-        snapshot = {
-            "id": self.device_model_id,
-            "name": name,
-            "model_code": model_code,
-            "category": category,
-        }
+        # 只解析一次 device_model，外层与 device_model 子对象共用同一组快照值
+        dm = self.device_model
+        name = self.snapshot_name or (dm.name if dm else None)
+        model_code = self.snapshot_model_code or (dm.model_code if dm else None)
+        category = self.snapshot_category or (dm.category if dm else None)
         return {
             "id": self.id,
             "plan_id": self.plan_id,
@@ -54,5 +48,10 @@ class PlanDeviceModel(TimestampMixin, db.Model):
             "name": name,
             "model_code": model_code,
             "category": category,
-            "device_model": snapshot,
+            "device_model": {
+                "id": self.device_model_id,
+                "name": name,
+                "model_code": model_code,
+                "category": category,
+            },
         }
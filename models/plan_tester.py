@@ -22,7 +22,7 @@ class TestPlanTester(TimestampMixin, db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
 
     test_plan = db.relationship("TestPlan", back_populates="plan_testers")
-    tester = db.relationship("User", backref=db.backref("plan_assignments", cascade="all, delete-orphan"))
+    tester = db.relationship("User", back_populates="plan_assignments")
 
     def to_dict(self):
         username = self.tester.username if self.tester else None
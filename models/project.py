@@ -37,7 +37,7 @@ class Project(TimestampMixin, SoftDeleteMixin, db.Model):
     department = db.relationship("Department", back_populates="projects")
     owner = db.relationship(
         "User",
-        backref=db.backref("owned_projects", passive_deletes=True),
+        back_populates="owned_projects",
         foreign_keys=[owner_user_id]
     )
     test_plans = db.relationship(
@@ -46,6 +46,7 @@ class Project(TimestampMixin, SoftDeleteMixin, db.Model):
     members = db.relationship(
         "ProjectMember", back_populates="project", cascade="all, delete-orphan"
     )
+    tags = db.relationship("Tag", back_populates="project", cascade="all, delete-orphan")
 
     def to_dict(self):
         return {
@@ -58,8 +59,8 @@ class Project(TimestampMixin, SoftDeleteMixin, db.Model):
             "description": self.description,
             "owner_user_id": self.owner_user_id,
             "owner_user_name": self.owner.username if self.owner else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
 
@@ -79,6 +80,4 @@ class ProjectMember(TimestampMixin, db.Model):
     role = db.Column(db.String(32), nullable=False, server_default="tester")
 
     project = db.relationship("Project", back_populates="members")
-    user = db.relationship(
-        "User", backref=db.backref("project_memberships", cascade="all, delete-orphan")
-    )
+    user = db.relationship("User", back_populates="project_memberships")
@@ -10,7 +10,8 @@ tag.py
 - 计划分组（版本标签）。
 - 执行结果标记（需要复测 / 数据缺失）。
 性能：
-- 针对高并发标签筛选，可考虑添加 (target_type, target_id, tag_id) 复合索引（当前唯一约束已可支撑）。
+- 多态 target 无法走外键关联，按 (target_type, target_id) 取标签依赖 ix_tag_map_target；
+  索引末尾带上 tag_id，取标签 id 时只读索引、不回表（MySQL 无 INCLUDE，以索引列代替）。
 """
 
 from extensions.database import db
@@ -29,14 +30,14 @@ class Tag(TimestampMixin, db.Model):
     name = db.Column(db.String(64), nullable=False)
     color = db.Column(db.String(16))  # #RRGGBB 或 token
 
-    project = db.relationship("Project", backref=db.backref("tags", cascade="all, delete-orphan"))
+    project = db.relationship("Project", back_populates="tags")
     mappings = db.relationship("TagMap", back_populates="tag", cascade="all, delete-orphan")
 
 
 class TagMap(TimestampMixin, db.Model):
     __tablename__ = "tag_map"
     __table_args__ = (
-        db.Index("ix_tag_map_target", "target_type", "target_id"),
+        db.Index("ix_tag_map_target", "target_type", "target_id", "tag_id"),
         db.UniqueConstraint("tag_id", "target_type", "target_id", name="uq_tag_map_tag_target"),
         COMMON_TABLE_ARGS,
     )
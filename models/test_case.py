@@ -19,6 +19,7 @@ class TestCase(TimestampMixin, SoftDeleteMixin, VersionMixin, db.Model):
     __table_args__ = (
         db.Index("ix_test_case_dept_group", "department_id", "group_id"),
         db.Index("ix_test_case_dept_status", "department_id", "status"),
+        db.Index("ix_test_case_dept_updated", "department_id", "updated_at"),  # 用例列表可按更新时间排序
         COMMON_TABLE_ARGS,
     )
 
@@ -75,22 +76,25 @@ class TestCase(TimestampMixin, SoftDeleteMixin, VersionMixin, db.Model):
     # 关系
     department = db.relationship("Department", back_populates="test_cases")
     group = db.relationship("CaseGroup", back_populates="test_cases")
+    # 集合关系使用普通懒加载列表（而非 lazy="dynamic"），需要时可在查询处 selectinload 批量加载；
+    # 外键已 ON DELETE CASCADE / SET NULL，passive_deletes 避免删除用例时先加载整个集合
+    # User 一侧的 created_cases / updated_cases 见 models/user.py
     creator = db.relationship(
         "User",
         foreign_keys=[created_by],
-        backref=db.backref("created_cases", lazy="dynamic")
+        back_populates="created_cases"
     )
     updater = db.relationship(
         "User",
         foreign_keys=[updated_by],
-        backref=db.backref("updated_cases", lazy="dynamic")
+        back_populates="updated_cases"
     )
 
     # 历史记录
     histories = db.relationship(
         "TestCaseHistory",
         back_populates="test_case",
-        lazy="dynamic",
+        passive_deletes=True,
         order_by="TestCaseHistory.version.desc()"
     )
 
@@ -98,5 +102,5 @@ class TestCase(TimestampMixin, SoftDeleteMixin, VersionMixin, db.Model):
     plan_cases = db.relationship(
         "PlanCase",
         back_populates="origin_case",
-        lazy="dynamic"
+        passive_deletes=True
     )
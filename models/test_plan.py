@@ -32,11 +32,21 @@ class TestPlan(TimestampMixin, db.Model):
     end_date = db.Column(db.Date)
 
     project = db.relationship("Project", back_populates="test_plans")
-    creator = db.relationship("User", backref=db.backref("created_plans", passive_deletes=True))
-    plan_cases = db.relationship("PlanCase", back_populates="test_plan", cascade="all, delete-orphan")
-    plan_device_models = db.relationship("PlanDeviceModel", back_populates="test_plan", cascade="all, delete-orphan")
-    execution_runs = db.relationship("ExecutionRun", back_populates="test_plan", cascade="all, delete-orphan")
-    plan_testers = db.relationship("TestPlanTester", back_populates="test_plan", cascade="all, delete-orphan")
+    creator = db.relationship("User", back_populates="created_plans")
+    # 子表外键均为 ON DELETE CASCADE：passive_deletes 让删除计划时由数据库级联，
+    # 不必把未加载的用例/批次/结果逐条读入会话再逐条 DELETE
+    plan_cases = db.relationship(
+        "PlanCase", back_populates="test_plan", cascade="all, delete-orphan", passive_deletes=True
+    )
+    plan_device_models = db.relationship(
+        "PlanDeviceModel", back_populates="test_plan", cascade="all, delete-orphan", passive_deletes=True
+    )
+    execution_runs = db.relationship(
+        "ExecutionRun", back_populates="test_plan", cascade="all, delete-orphan", passive_deletes=True
+    )
+    plan_testers = db.relationship(
+        "TestPlanTester", back_populates="test_plan", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def to_dict(
         self,
@@ -56,10 +66,10 @@ class TestPlan(TimestampMixin, db.Model):
             "description": self.description,
             "created_by": self.created_by,
             "created_by_name": self.creator.username if self.creator else None,
-            "start_date": self.start_date.isoformat() if self.start_date else None,
-            "end_date": self.end_date.isoformat() if self.end_date else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
         if include_device_models:
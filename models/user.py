@@ -13,7 +13,7 @@ user.py
 
 from extensions.database import db
 from .mixins import TimestampMixin, COMMON_TABLE_ARGS
-from constants.roles import SystemRole
+from constants.roles import SystemRole, ROLE_LABELS_ZH
 from datetime import datetime
 
 
@@ -31,12 +31,30 @@ class User(TimestampMixin, db.Model):
     password_version = db.Column(db.Integer, nullable=False, server_default="1")
     password_updated_at = db.Column(db.DateTime)
 
+    # 反向关系：两侧均显式声明 back_populates，便于按方向分别设置加载策略。
+    # 外键为 ON DELETE SET NULL 的集合使用 passive_deletes，删除用户时交给数据库处理
+    owned_projects = db.relationship(
+        "Project", back_populates="owner", foreign_keys="Project.owner_user_id", passive_deletes=True
+    )
+    project_memberships = db.relationship(
+        "ProjectMember", back_populates="user", cascade="all, delete-orphan"
+    )
+    plan_assignments = db.relationship(
+        "TestPlanTester", back_populates="tester", cascade="all, delete-orphan"
+    )
+    created_plans = db.relationship("TestPlan", back_populates="creator", passive_deletes=True)
+    created_cases = db.relationship(
+        "TestCase", back_populates="creator", foreign_keys="TestCase.created_by", passive_deletes=True
+    )
+    updated_cases = db.relationship(
+        "TestCase", back_populates="updater", foreign_keys="TestCase.updated_by", passive_deletes=True
+    )
+
     def __repr__(self):
         return f"<User id={self.id} username={self.username} role={self.role}>"
 
     @property
     def role_label(self) -> str:
-        from constants.roles import ROLE_LABELS_ZH
         return ROLE_LABELS_ZH.get(self.role, self.role)
 
     def touch_password_time(self):
@@ -4,6 +4,7 @@ from .mixins import TimestampMixin, COMMON_TABLE_ARGS
 
 class UserPasswordHistory(TimestampMixin, db.Model):
     __tablename__ = "user_password_history"
+    __index_created_at__ = False
     __table_args__ = (COMMON_TABLE_ARGS,)
 
     id = db.Column(db.Integer, primary_key=True)
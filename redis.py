@@ -4,6 +4,10 @@ import time
 from typing import Any, Dict, Optional, Tuple
 
 
+class RedisError(Exception):
+    """与 redis-py 顶层导出的异常基类同名，供调用方捕获。"""
+
+
 class RedisStub:  # pragma: no cover - 占位实现
     def __init__(self, url: str):
         self.url = url
@@ -20,6 +24,9 @@ class RedisStub:  # pragma: no cover - 占位实现
             return None
         return value
 
+    def exists(self, *names: str) -> int:
+        return sum(1 for name in names if self.get(name) is not None)
+
     def set(self, name: str, value: Any, *_args, **_kwargs):
         self._store[name] = (value, None)
         return True
@@ -29,6 +36,15 @@ class RedisStub:  # pragma: no cover - 占位实现
         self._store[name] = (value, expires_at)
         return True
 
+    def incr(self, name: str, amount: int = 1) -> int:
+        value = int(self.get(name) or 0) + amount
+        _, expires_at = self._store.get(name, (None, None))
+        self._store[name] = (value, expires_at)
+        return value
+
+    def delete(self, *names: str) -> int:
+        return sum(1 for name in names if self._store.pop(name, None) is not None)
+
     def close(self):  # pragma: no cover
         pass
 
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from typing import Iterable, Mapping
 
+from sqlalchemy import delete, insert, select, update
+
 from extensions.database import db
 from models.attachment import Attachment
 
+# 复用现有附件行时需要与提交内容比对、必要时覆盖的列
+_METADATA_COLUMNS = ("file_name", "stored_file_name", "file_path", "mime_type", "size", "uploaded_by")
+
 
 class AttachmentRepository:
     """附件相关的持久化操作。
@@ -18,27 +23,72 @@ class AttachmentRepository:
 
     @staticmethod
     def replace_target_attachments(target_type: str, target_id: int, payloads: Iterable[Mapping]):
-        """替换某个实体上的附件列表。"""
+        """替换某个实体上的附件列表。
+
+        按 stored_file_name 与现有附件比对：仍在列表中的复用原行，元数据有变化的
+        按主键批量 UPDATE；不再出现的一条 DELETE 删除，新增的一条 INSERT 批量写入。
+        """
 
-        db.session.query(Attachment).filter(
-            Attachment.target_type == target_type,
-            Attachment.target_id == target_id,
-        ).delete(synchronize_session=False)
+        existing: dict[str, list[dict]] = {}
+        for row in db.session.execute(
+            select(Attachment.id, *(getattr(Attachment, column) for column in _METADATA_COLUMNS)).where(
+                Attachment.target_type == target_type,
+                Attachment.target_id == target_id,
+            )
+        ).mappings():
+            existing.setdefault(row["stored_file_name"], []).append(dict(row))
+
+        new_payloads = []
+        changed_rows = []
         for item in payloads:
-            AttachmentRepository.add_attachment(target_type, target_id, item)
+            # 每条现有附件只被复用一次，多出的同名提交仍按新增处理
+            matches = existing.get(item.get("stored_file_name"))
+            if not matches:
+                new_payloads.append(item)
+                continue
+            current = matches.pop()
+            row = AttachmentRepository._attachment_row(target_type, target_id, item)
+            if any(current[column] != row[column] for column in _METADATA_COLUMNS):
+                changed_rows.append({"id": current["id"], **{column: row[column] for column in _METADATA_COLUMNS}})
+
+        stale_ids = [current["id"] for matches in existing.values() for current in matches]
+        if stale_ids:
+            db.session.execute(
+                delete(Attachment)
+                .where(Attachment.id.in_(stale_ids))
+                .execution_options(synchronize_session=False)
+            )
+        if changed_rows:
+            # 按主键的 ORM 批量 UPDATE（executemany）
+            db.session.execute(update(Attachment), changed_rows)
+        AttachmentRepository.bulk_add_attachments(target_type, target_id, new_payloads)
+
+    @staticmethod
+    def bulk_add_attachments(target_type: str, target_id: int, payloads: Iterable[Mapping]) -> None:
+        """批量写入附件元数据（单条多行 INSERT / executemany）。"""
+
+        rows = [
+            AttachmentRepository._attachment_row(target_type, target_id, payload)
+            for payload in payloads
+        ]
+        if rows:
+            db.session.execute(insert(Attachment), rows)
 
     @staticmethod
     def add_attachment(target_type: str, target_id: int, payload: Mapping) -> Attachment:
-        attachment = Attachment(
-            target_type=target_type,
-            target_id=target_id,
-            file_name=payload.get("file_name"),
-            stored_file_name=payload.get("stored_file_name"),
-            file_path=payload.get("file_path"),
-            mime_type=payload.get("mime_type"),
-            size=payload.get("size"),
-            uploaded_by=payload.get("uploaded_by"),
-        )
+        attachment = Attachment(**AttachmentRepository._attachment_row(target_type, target_id, payload))
         db.session.add(attachment)
         return attachment
 
+    @staticmethod
+    def _attachment_row(target_type: str, target_id: int, payload: Mapping) -> dict:
+        return {
+            "target_type": target_type,
+            "target_id": target_id,
+            "file_name": payload.get("file_name"),
+            "stored_file_name": payload.get("stored_file_name"),
+            "file_path": payload.get("file_path"),
+            "mime_type": payload.get("mime_type"),
+            "size": payload.get("size"),
+            "uploaded_by": payload.get("uploaded_by"),
+        }
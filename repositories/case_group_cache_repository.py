@@ -0,0 +1,70 @@
+# repositories/case_group_cache_repository.py
+import json
+import logging
+from typing import List, Optional
+from extensions.redis_client import get_redis, redis_error
+
+logger = logging.getLogger(__name__)
+
+# 载荷结构变化时递增版本号，旧结构的缓存自然失效
+TREE_PREFIX = "case_group:tree:v2:"
+TREE_TTL_SECONDS = 300
+# 每个部门一个代号计数器；树缓存键带上代号，失效即递增代号
+TREE_GENERATION_PREFIX = "case_group:tree:gen:"
+
+
+class CaseGroupCacheRepository:
+    """
+    部门分组树的行数据缓存；分组写操作提交后由服务层调用 invalidate_tree 清除。
+
+    缓存只是加速手段：Redis 不可用时读取返回未命中、写入与失效静默跳过（记录告警日志），
+    调用方回退到数据库，写操作不会因清缓存失败而报错。
+    """
+
+    @staticmethod
+    def get_generation(department_id: int) -> Optional[int]:
+        """
+        读取部门当前的缓存代号，查库前调用，并原样传给 set_tree_rows。
+
+        读者在查库与回写之间若有写操作提交，代号已被递增，回写落在旧代号的键上，
+        之后的读者不会读到这份过期数据（旧键随 TTL 过期）。Redis 不可用时返回 None。
+        """
+        try:
+            raw = get_redis().get(f"{TREE_GENERATION_PREFIX}{department_id}")
+        except redis_error() as exc:
+            logger.warning("读取分组树缓存代号失败 department_id=%s: %s", department_id, exc)
+            return None
+        return int(raw) if raw else 0
+
+    @staticmethod
+    def get_tree_rows(department_id: int, generation: Optional[int]) -> Optional[List[dict]]:
+        if generation is None:
+            return None
+        try:
+            raw = get_redis().get(f"{TREE_PREFIX}{department_id}:{generation}")
+        except redis_error() as exc:
+            logger.warning("读取分组树缓存失败 department_id=%s: %s", department_id, exc)
+            return None
+        return json.loads(raw) if raw else None
+
+    @staticmethod
+    def set_tree_rows(department_id: int, generation: Optional[int], rows: List[dict]):
+        if generation is None:
+            return
+        try:
+            get_redis().setex(
+                f"{TREE_PREFIX}{department_id}:{generation}",
+                TREE_TTL_SECONDS,
+                json.dumps(rows, ensure_ascii=False),
+            )
+        except redis_error() as exc:
+            logger.warning("写入分组树缓存失败 department_id=%s: %s", department_id, exc)
+
+    @staticmethod
+    def invalidate_tree(department_id: int):
+        # 递增代号而非删除键：与并发读者的回写不存在先后竞争。
+        # Redis 不可用时只记录日志，已缓存的旧树最多在 TTL 内被读到
+        try:
+            get_redis().incr(f"{TREE_GENERATION_PREFIX}{department_id}")
+        except redis_error() as exc:
+            logger.warning("清除分组树缓存失败 department_id=%s: %s", department_id, exc)
@@ -1,41 +1,57 @@
 from typing import List, Dict, Optional, Tuple, Iterable
-from sqlalchemy import func, and_, or_, desc, asc
+from sqlalchemy import func, and_, or_, desc, asc, update, select, bindparam
 from extensions.database import db
 from models.case_group import CaseGroup
 from models.test_case import TestCase
+from utils.query import strict
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 分组树只用到的列
+_TREE_COLUMNS = (
+    CaseGroup.id,
+    CaseGroup.name,
+    CaseGroup.path,
+    CaseGroup.parent_id,
+    CaseGroup.order_no,
+)
+
+# get_by_id 为高频点查询，语句在模块加载时构造一次，调用时只绑定参数
+_GET_BY_ID = select(CaseGroup).where(CaseGroup.id == bindparam("group_id"))
+_GET_ACTIVE_BY_ID = _GET_BY_ID.where(CaseGroup.is_deleted.is_(False))
+
 
 class CaseGroupRepository:
 
     @staticmethod
     def get_by_id(group_id: int, include_deleted: bool = False) -> Optional[CaseGroup]:
-        q = CaseGroup.query
-        if not include_deleted and hasattr(CaseGroup, "is_deleted"):
-            q = q.filter(CaseGroup.is_deleted.is_(False))
-        return q.filter(CaseGroup.id == group_id).first()
+        stmt = _GET_BY_ID if include_deleted else _GET_ACTIVE_BY_ID
+        return db.session.execute(stmt, {"group_id": group_id}).scalar_one_or_none()
 
     @staticmethod
-    def list_by_department(department_id: int, include_deleted: bool = False) -> List[CaseGroup]:
+    def list_by_department(department_id: int, include_deleted: bool = False):
+        """
+        部门下全部分组，用于组装分组树。
+        只取 _TREE_COLUMNS 列，返回按列名取值的行元组，不构造 ORM 实例。
+        """
         q = CaseGroup.query.filter(CaseGroup.department_id == department_id)
-        if not include_deleted and hasattr(CaseGroup, "is_deleted"):
+        if not include_deleted:
             q = q.filter(CaseGroup.is_deleted.is_(False))
         return q.order_by(
             (CaseGroup.parent_id.is_(None)).desc(),  # 先把 NULL 放前面
             CaseGroup.order_no,
             CaseGroup.id
-        ).all()
+        ).with_entities(*_TREE_COLUMNS).all()
 
     @staticmethod
     def list_children(department_id: int, parent_id: Optional[int], include_deleted: bool = False) -> List[CaseGroup]:
-        q = CaseGroup.query.filter(
+        q = strict(CaseGroup.query).filter(
             CaseGroup.department_id == department_id,
             CaseGroup.parent_id == parent_id
         )
-        if not include_deleted and hasattr(CaseGroup, "is_deleted"):
+        if not include_deleted:
             q = q.filter(CaseGroup.is_deleted.is_(False))
         return q.order_by(CaseGroup.order_no, CaseGroup.id).all()
 
@@ -49,8 +65,7 @@ class CaseGroupRepository:
         )
         if exclude_id:
             q = q.filter(CaseGroup.id != exclude_id)
-        if hasattr(CaseGroup, "is_deleted"):
-            q = q.filter(CaseGroup.is_deleted.is_(False))
+        q = q.filter(CaseGroup.is_deleted.is_(False))
         return db.session.query(q.exists()).scalar()
 
     @staticmethod
@@ -65,7 +80,7 @@ class CaseGroupRepository:
             CaseGroup.parent_id == parent_id,
             CaseGroup.name == name
         )
-        if not include_deleted and hasattr(CaseGroup, "is_deleted"):
+        if not include_deleted:
             q = q.filter(CaseGroup.is_deleted.is_(False))
         return q.first()
 
@@ -78,7 +93,7 @@ class CaseGroupRepository:
 
     @staticmethod
     def delete_groups_soft(group_ids: Iterable[int], department_id: int, user_id: int) -> int:
-        """批量软删除分组"""
+        """批量软删除分组；只执行 UPDATE，不提交，由调用方统一提交事务"""
         if not group_ids:
             return 0
         affected = CaseGroup.query.filter(
@@ -95,19 +110,18 @@ class CaseGroupRepository:
             },
             synchronize_session=False
         )
-        db.session.commit()
         return affected
 
     @staticmethod
     def get_descendants(group: CaseGroup) -> List[CaseGroup]:
         # 利用 path 前缀匹配
+        # autoescape：分组名中的 % / _ 按字面匹配；仍是左前缀 LIKE，可走 ix_case_group_path
         prefix = group.path + "/"
         q = CaseGroup.query.filter(
             CaseGroup.department_id == group.department_id,
-            CaseGroup.path.like(f"{prefix}%")
+            CaseGroup.path.startswith(prefix, autoescape=True)
         )
-        if hasattr(CaseGroup, "is_deleted"):
-            q = q.filter(CaseGroup.is_deleted.is_(False))
+        q = q.filter(CaseGroup.is_deleted.is_(False))
         return q.all()
 
     @staticmethod
@@ -115,17 +129,21 @@ class CaseGroupRepository:
         prefix = old_path + "/"
         q = CaseGroup.query.filter(
             CaseGroup.department_id == department_id,
-            CaseGroup.path.like(f"{prefix}%")
+            CaseGroup.path.startswith(prefix, autoescape=True)
         )
-        if hasattr(CaseGroup, "is_deleted"):
-            q = q.filter(CaseGroup.is_deleted.is_(False))
+        q = q.filter(CaseGroup.is_deleted.is_(False))
         return q.all()
 
     @staticmethod
     def get_descendant_ids_inclusive(group: CaseGroup) -> List[int]:
-        descendants = CaseGroupRepository.get_descendants(group)
-        ids = [group.id] + [g.id for g in descendants]
-        return ids
+        # 只取 id 列，不为每个后代分组构造 ORM 实例
+        prefix = group.path + "/"
+        q = db.session.query(CaseGroup.id).filter(
+            CaseGroup.department_id == group.department_id,
+            CaseGroup.path.startswith(prefix, autoescape=True),
+            CaseGroup.is_deleted.is_(False),
+        )
+        return [group.id] + [gid for (gid,) in q]
 
     @staticmethod
     def update_group_parent_and_name(group: CaseGroup, new_parent: Optional[CaseGroup], new_name: Optional[str],
@@ -152,17 +170,23 @@ class CaseGroupRepository:
         """
         updates: list of (group_id, new_path)
         """
-        for gid, np in updates:
-            db.session.query(CaseGroup).filter(CaseGroup.id == gid).update({"path": np})
+        if not updates:
+            return
+        # 按主键批量 UPDATE，整棵子树只发一次 executemany
+        db.session.execute(
+            update(CaseGroup),
+            [{"id": gid, "path": np} for gid, np in updates],
+        )
 
     @staticmethod
     def collect_test_case_ids_by_group_ids(group_ids: List[int]) -> List[int]:
         if not group_ids:
             return []
-        q = TestCase.query.filter(TestCase.group_id.in_(group_ids))
-        if hasattr(TestCase, "is_deleted"):
-            q = q.filter(TestCase.is_deleted.is_(False))
-        return [tc.id for tc in q]
+        q = db.session.query(TestCase.id).filter(
+            TestCase.group_id.in_(group_ids),
+            TestCase.is_deleted.is_(False),
+        )
+        return [tc_id for (tc_id,) in q]
 
     @staticmethod
     def count_cases_grouped(group_ids: List[int]) -> Dict[int, int]:
@@ -171,8 +195,9 @@ class CaseGroupRepository:
         q = db.session.query(
             TestCase.group_id,
             func.count(TestCase.id)
-        ).filter(TestCase.group_id.in_(group_ids))
-        if hasattr(TestCase, "is_deleted"):
-            q = q.filter(TestCase.is_deleted.is_(False))
+        ).filter(
+            TestCase.group_id.in_(group_ids),
+            TestCase.is_deleted.is_(False),
+        )
         q = q.group_by(TestCase.group_id)
         return {gid: cnt for gid, cnt in q.all()}
@@ -2,6 +2,7 @@
 from typing import Optional, List, Tuple, Dict
 from sqlalchemy import select, func, or_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager
 from extensions.database import db
 from models.department import DepartmentMember
 from models.user import User
@@ -41,14 +42,20 @@ class DepartmentMemberRepository:
     @staticmethod
     def list(dept_id: int, keyword: Optional[str], role: Optional[str],
              page: int, page_size: int, order_by: str = "-id") -> Tuple[List[DepartmentMember], int]:
-        stmt = select(DepartmentMember).where(DepartmentMember.department_id == dept_id).join(User)
+        # 已 join User 用于过滤/排序，顺带填充 member.user，to_dict(user_basic=True) 不再逐条查询
+        stmt = (
+            select(DepartmentMember)
+            .where(DepartmentMember.department_id == dept_id)
+            .join(DepartmentMember.user)
+            .options(contains_eager(DepartmentMember.user))
+        )
         if role:
             stmt = stmt.where(DepartmentMember.role == role)
         if keyword:
             like = f"%{keyword.strip()}%"
             stmt = stmt.where(or_(User.username.ilike(like), User.email.ilike(like)))
 
-        # 排序支持 user.username / id / role
+        # 排序支持 user.username / id / role；非唯一列追加 id 作为次序键，保证分页边界稳定
         if order_by:
             desc = order_by.startswith("-")
             field = order_by[1:] if desc else order_by
@@ -58,6 +65,8 @@ class DepartmentMemberRepository:
                 col = getattr(DepartmentMember, field, None)
             if col is not None:
                 stmt = stmt.order_by(col.desc() if desc else col.asc())
+                if field != "id":
+                    stmt = stmt.order_by(DepartmentMember.id.desc() if desc else DepartmentMember.id.asc())
             else:
                 stmt = stmt.order_by(DepartmentMember.id.desc())
         else:
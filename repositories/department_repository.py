@@ -1,6 +1,6 @@
 # repositories/department_repository.py
 from typing import Optional, List, Tuple
-from sqlalchemy import select, func, or_, case, desc, asc
+from sqlalchemy import select, func, or_, case, desc, asc, literal, union_all
 from sqlalchemy.exc import IntegrityError
 from extensions.database import db
 from models.department import Department
@@ -10,6 +10,7 @@ from models.department import Department, DepartmentMember
 from models.project import Project
 from models.test_case import TestCase
 from models.device_model import DeviceModel
+from utils.query import strict
 
 
 class DepartmentRepository:
@@ -55,7 +56,7 @@ class DepartmentRepository:
         :return: (部门列表, 总数, 计数数据)
         """
         # 构建基础查询
-        stmt = select(Department)
+        stmt = strict(select(Department))
         count_stmt = select(func.count(Department.id))
 
         # 构建筛选条件
@@ -82,11 +83,10 @@ class DepartmentRepository:
             stmt = stmt.where(*conditions)
             count_stmt = count_stmt.where(*conditions)
 
-        # 排序
-        if order_desc:
-            stmt = stmt.order_by(desc(Department.created_at))
-        else:
-            stmt = stmt.order_by(asc(Department.created_at))
+        # 排序：created_at 精度为秒，id 作为次序键保证同一秒创建的部门分页顺序稳定；
+        # InnoDB 二级索引隐含主键，(created_at, id) 仍可直接走 created_at 索引有序扫描
+        order = desc if order_desc else asc
+        stmt = stmt.order_by(order(Department.created_at), order(Department.id))
 
         # 获取总数
         total = db.session.execute(count_stmt).scalar()
@@ -99,12 +99,12 @@ class DepartmentRepository:
         counts_data = {}
         if departments:
             dept_ids = [d.id for d in departments]
-            counts_data = DepartmentRepository._get_batch_counts(dept_ids)
+            counts_data = DepartmentRepository.get_batch_counts(dept_ids)
 
         return departments, total, counts_data
 
     @staticmethod
-    def _get_batch_counts(dept_ids: List[int]) -> Dict[int, Dict]:
+    def get_batch_counts(dept_ids: List[int]) -> Dict[int, Dict]:
         """批量获取部门的统计数据，避免N+1查询"""
         if not dept_ids:
             return {}
@@ -120,52 +120,28 @@ class DepartmentRepository:
             for dept_id in dept_ids
         }
 
-        def _apply_counts(query, key: str):
-            for dept_id, value in query:
-                counts_data[dept_id][key] = value or 0
-
-        # 分别统计，避免一次性 JOIN 导致的行数爆炸
-        members_query = (
-            db.session.query(
-                DepartmentMember.department_id,
-                func.count(DepartmentMember.id)
+        # 四项统计各自按部门分组后 UNION ALL 合并为一条语句，一次往返取回；
+        # 分别聚合而非一次性 JOIN，避免多表连接导致的行数爆炸
+        def _grouped(key: str, dept_col, count_expr):
+            return (
+                select(dept_col.label("department_id"), literal(key).label("key"), count_expr.label("value"))
+                .where(dept_col.in_(dept_ids))
+                .group_by(dept_col)
             )
-            .filter(DepartmentMember.department_id.in_(dept_ids))
-            .group_by(DepartmentMember.department_id)
-        )
-        _apply_counts(members_query.all(), "members")
-
-        projects_query = (
-            db.session.query(
-                Project.department_id,
-                func.count(Project.id)
-            )
-            .filter(Project.department_id.in_(dept_ids))
-            .group_by(Project.department_id)
-        )
-        _apply_counts(projects_query.all(), "projects")
 
-        test_cases_query = (
-            db.session.query(
-                TestCase.department_id,
-                func.count(TestCase.id)
-            )
-            .filter(TestCase.department_id.in_(dept_ids))
-            .group_by(TestCase.department_id)
-        )
-        _apply_counts(test_cases_query.all(), "test_cases")
-
-        device_models_query = (
-            db.session.query(
+        stmt = union_all(
+            _grouped("members", DepartmentMember.department_id, func.count(DepartmentMember.id)),
+            _grouped("projects", Project.department_id, func.count(Project.id)),
+            _grouped("test_cases", TestCase.department_id, func.count(TestCase.id)),
+            # 仅统计启用的机型；COUNT(CASE ...) 保持整数类型，与其余分支一致
+            _grouped(
+                "device_models",
                 DeviceModel.department_id,
-                func.sum(
-                    case((DeviceModel.active == True, 1), else_=0)  # noqa: E712
-                ),
-            )
-            .filter(DeviceModel.department_id.in_(dept_ids))
-            .group_by(DeviceModel.department_id)
+                func.count(case((DeviceModel.active == True, DeviceModel.id))),  # noqa: E712
+            ),
         )
-        _apply_counts(device_models_query.all(), "device_models")
+        for dept_id, key, value in db.session.execute(stmt):
+            counts_data[dept_id][key] = int(value or 0)
 
         return counts_data
 
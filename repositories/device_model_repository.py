@@ -1,10 +1,21 @@
 from typing import List, Optional, Tuple
 
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import asc, bindparam, desc, func, select
 from sqlalchemy.exc import IntegrityError
 
 from extensions.database import db
 from models.device_model import DeviceModel
+from utils.query import strict
+
+# 高频点查询在模块加载时构造一次，调用时只绑定参数：
+# 省去每次调用重建语句与生成缓存键的开销，直接命中引擎的编译缓存
+_GET_BY_ID = select(DeviceModel).where(DeviceModel.id == bindparam("device_model_id"))
+_GET_ACTIVE_BY_ID = _GET_BY_ID.where(DeviceModel.active == True)  # noqa: E712
+_GET_ACTIVE_BY_DEPT_AND_NAME = select(DeviceModel).where(
+    DeviceModel.department_id == bindparam("department_id"),
+    DeviceModel.name == bindparam("name"),
+    DeviceModel.active == True,  # noqa: E712
+)
 
 
 class DeviceModelRepository:
@@ -18,19 +29,14 @@ class DeviceModelRepository:
 
     @staticmethod
     def get_by_id(device_model_id: int, include_inactive: bool = False) -> Optional[DeviceModel]:
-        stmt = select(DeviceModel).where(DeviceModel.id == device_model_id)
-        if not include_inactive:
-            stmt = stmt.where(DeviceModel.active == True)  # noqa: E712
-        return db.session.execute(stmt).scalar_one_or_none()
+        stmt = _GET_BY_ID if include_inactive else _GET_ACTIVE_BY_ID
+        return db.session.execute(stmt, {"device_model_id": device_model_id}).scalar_one_or_none()
 
     @staticmethod
     def get_by_dept_and_name(department_id: int, name: str) -> Optional[DeviceModel]:
-        stmt = select(DeviceModel).where(
-            DeviceModel.department_id == department_id,
-            DeviceModel.name == name,
-            DeviceModel.active == True,  # noqa: E712
-        )
-        return db.session.execute(stmt).scalar_one_or_none()
+        return db.session.execute(
+            _GET_ACTIVE_BY_DEPT_AND_NAME, {"department_id": department_id, "name": name}
+        ).scalar_one_or_none()
 
     @staticmethod
     def list(
@@ -53,7 +59,7 @@ class DeviceModelRepository:
         if category:
             conditions.append(DeviceModel.category == category)
 
-        stmt = select(DeviceModel).where(*conditions)
+        stmt = strict(select(DeviceModel)).where(*conditions)
         count_stmt = select(func.count(DeviceModel.id)).where(*conditions)
 
         if order_desc:
@@ -4,6 +4,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
 from extensions.database import db
 from models.project import Project
+from utils.query import strict
 
 
 class ProjectRepository:
@@ -63,7 +64,8 @@ class ProjectRepository:
         order_desc: bool = True,
         accessible_department_ids: Optional[List[int]] = None,
     ) -> Tuple[List[Project], int]:
-        stmt = select(Project).options(
+        stmt = strict(
+            select(Project),
             selectinload(Project.department),
             selectinload(Project.owner),
         )
@@ -1,9 +1,11 @@
 # repositories/test_case_repository.py
 from typing import List, Optional, Tuple, Dict, Any
 from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy.orm import selectinload
 from extensions.database import db
 from models.test_case import TestCase
 from models.test_case_history import TestCaseHistory
+from utils.query import strict
 from datetime import datetime
 
 
@@ -54,7 +56,13 @@ class TestCaseRepository:
             order_desc: bool = True
     ) -> Tuple[List[TestCase], int]:
         """分页查询部门下的测试用例"""
-        query = TestCase.query_active().filter_by(department_id=department_id)
+        # 列表接口逐行输出创建者、更新者与分组信息，统一批量加载
+        query = strict(
+            TestCase.query_active(),
+            selectinload(TestCase.creator),
+            selectinload(TestCase.updater),
+            selectinload(TestCase.group),
+        ).filter_by(department_id=department_id)
 
         # 应用过滤条件
         if title:
@@ -2,16 +2,39 @@ from __future__ import annotations
 
 from typing import List, Optional, Tuple
 
-from sqlalchemy import asc, desc, func, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import asc, desc, func, insert, select, update
+from sqlalchemy.orm import contains_eager, selectinload
 
+from constants.test_plan import ExecutionResultStatus, TestPlanStatus
 from extensions.database import db
 from models.project import Project
+from models.test_case import TestCase
 from models.test_plan import TestPlan
 from models.plan_case import PlanCase
 from models.plan_device_model import PlanDeviceModel
 from models.plan_tester import TestPlanTester
 from models.execution import ExecutionRun, ExecutionResult, ExecutionResultLog
+from utils.query import strict
+
+
+# 执行结果状态 -> ExecutionRun 上对应的冗余计数列（pending 只计入 not_run）
+_RESULT_COUNTER_COLUMNS = {
+    ExecutionResultStatus.PASS.value: "passed",
+    ExecutionResultStatus.FAIL.value: "failed",
+    ExecutionResultStatus.BLOCK.value: "blocked",
+    ExecutionResultStatus.SKIP.value: "skipped",
+}
+_RUN_COUNTER_FIELDS = ["total", "executed", "passed", "failed", "blocked", "skipped", "not_run"]
+
+
+def _result_detail_loaders(results_loader):
+    """ExecutionResult.to_dict 会访问的多对一关系，随结果一起批量加载，避免逐条懒加载（N+1）。"""
+
+    return [
+        results_loader.selectinload(ExecutionResult.plan_device_model).selectinload(PlanDeviceModel.device_model),
+        results_loader.selectinload(ExecutionResult.device_model),
+        results_loader.selectinload(ExecutionResult.executor),
+    ]
 
 
 class TestPlanRepository:
@@ -57,14 +80,20 @@ class TestPlanRepository:
             run_loader = selectinload(TestPlan.execution_runs)
             if load_execution_run_results:
                 run_loader = run_loader.selectinload(ExecutionRun.execution_results)
+                options.extend(_result_detail_loaders(run_loader))
             options.append(run_loader)
         if load_cases:
             cases_loader = selectinload(TestPlan.plan_cases)
             options.append(cases_loader)
-            options.append(cases_loader.selectinload(PlanCase.origin_case))
+            # 计划用例序列化时只从源用例读取 keywords，其余列（步骤、预期结果等大字段）不再加载，
+            # 误访问时直接报错而不是逐行懒加载
+            options.append(
+                cases_loader.selectinload(PlanCase.origin_case).load_only(TestCase.keywords, raiseload=True)
+            )
             if load_case_results:
                 results_loader = cases_loader.selectinload(PlanCase.execution_results)
                 options.append(results_loader)
+                options.extend(_result_detail_loaders(results_loader))
 
                 if load_case_result_attachments:
                     options.append(results_loader.selectinload(ExecutionResult.attachments))
@@ -99,6 +128,7 @@ class TestPlanRepository:
 
         if include_results:
             base = selectinload(PlanCase.execution_results)
+            load_opts.extend(_result_detail_loaders(base))
 
             # execution_results -> attachments
             if include_result_attachments:
@@ -115,7 +145,7 @@ class TestPlanRepository:
                         .selectinload(ExecutionResultLog.attachments)
                     )
 
-        load_opts.append(selectinload(PlanCase.origin_case))
+        load_opts.append(selectinload(PlanCase.origin_case).load_only(TestCase.keywords, raiseload=True))
 
         if load_opts:
             stmt = stmt.options(*load_opts)
@@ -137,10 +167,16 @@ class TestPlanRepository:
         order_desc: bool = True,
         accessible_department_ids: Optional[List[int]] = None,
     ) -> Tuple[List[TestPlan], int]:
-        stmt = select(TestPlan).options(
-            selectinload(TestPlan.project).selectinload(Project.department),
+        # 与列表序列化 to_dict(include_cases=False, include_runs=False) 访问的关系一一对应：
+        # creator 取创建人名称，execution_runs 用于计算最新批次统计。
+        # project 为必填外键，直接内连接：部门过滤复用这次 JOIN，并由 contains_eager 填充 plan.project
+        stmt = strict(
+            select(TestPlan).join(TestPlan.project),
+            contains_eager(TestPlan.project).selectinload(Project.department),
+            selectinload(TestPlan.creator),
             selectinload(TestPlan.plan_device_models).selectinload(PlanDeviceModel.device_model),
             selectinload(TestPlan.plan_testers).selectinload(TestPlanTester.tester),
+            selectinload(TestPlan.execution_runs),
         )
         count_stmt = select(func.count(TestPlan.id))
 
@@ -148,12 +184,15 @@ class TestPlanRepository:
         if project_id:
             conditions.append(TestPlan.project_id == project_id)
         if department_id:
-            conditions.append(TestPlan.project.has(Project.department_id == department_id))
+            conditions.append(Project.department_id == department_id)
         elif accessible_department_ids is not None:
             ids = list({int(i) for i in accessible_department_ids})
             if not ids:
                 return [], 0
-            conditions.append(TestPlan.project.has(Project.department_id.in_(ids)))
+            conditions.append(Project.department_id.in_(ids))
+        if department_id or accessible_department_ids is not None:
+            # 仅按部门过滤时计数才需要关联 project
+            count_stmt = count_stmt.join(TestPlan.project)
         if status:
             conditions.append(TestPlan.status == status)
         if keyword:
@@ -162,7 +201,9 @@ class TestPlanRepository:
             stmt = stmt.where(*conditions)
             count_stmt = count_stmt.where(*conditions)
 
-        stmt = stmt.order_by(desc(TestPlan.created_at) if order_desc else asc(TestPlan.created_at))
+        # created_at 精度为秒，id 作为次序键保证同一秒创建的计划分页顺序稳定
+        order = desc if order_desc else asc
+        stmt = stmt.order_by(order(TestPlan.created_at), order(TestPlan.id))
         total = db.session.execute(count_stmt).scalar() or 0
         stmt = stmt.offset((page - 1) * page_size).limit(page_size)
         items = db.session.execute(stmt).scalars().all()
@@ -192,6 +233,94 @@ class TestPlanRepository:
     def add_execution_result(result: ExecutionResult):
         db.session.add(result)
 
+    @staticmethod
+    def bulk_add_execution_results(rows: List[dict]) -> None:
+        """批量插入执行结果（单条多行 INSERT / executemany），rows 为列名到值的字典列表。"""
+        if rows:
+            db.session.execute(insert(ExecutionResult), rows)
+
+    @staticmethod
+    def apply_result_delta(run: ExecutionRun, old_result: Optional[str], new_result: str) -> None:
+        """
+        结果状态变化时，以 UPDATE ... SET col = col ± 1 原子地调整批次计数，并回读最新计数到 run。
+        UPDATE 持有行锁直到提交，并发录入不会相互覆盖计数。
+        old_result 必须在结果行加锁（SELECT ... FOR UPDATE）后读取，否则两个事务读到同一旧值会重复累加。
+        """
+        deltas: dict = {}
+        old_column = _RESULT_COUNTER_COLUMNS.get(old_result)
+        new_column = _RESULT_COUNTER_COLUMNS.get(new_result)
+        if old_column == new_column:
+            return
+        for column, step in ((old_column, -1), (new_column, 1)):
+            if column:
+                deltas[column] = deltas.get(column, 0) + step
+                deltas["executed"] = deltas.get("executed", 0) + step
+                deltas["not_run"] = deltas.get("not_run", 0) - step
+
+        values = {
+            name: getattr(ExecutionRun, name) + delta
+            for name, delta in deltas.items()
+            if delta
+        }
+        if values:
+            db.session.execute(
+                update(ExecutionRun)
+                .where(ExecutionRun.id == run.id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        db.session.refresh(run, attribute_names=_RUN_COUNTER_FIELDS)
+
+    @staticmethod
+    def count_results_by_status(run_id: int) -> dict:
+        """按状态统计某批次的执行结果数量：{result: count}。"""
+        rows = db.session.execute(
+            select(ExecutionResult.result, func.count())
+            .where(ExecutionResult.run_id == run_id)
+            .group_by(ExecutionResult.result)
+        ).all()
+        return {result: count for result, count in rows}
+
+    @staticmethod
+    def list_unarchived_plan_runs() -> list:
+        """未归档计划及其批次：[(plan_id, run_id, end_time)]，没有批次的计划 run_id 为 None。"""
+        return db.session.execute(
+            select(TestPlan.id, ExecutionRun.id, ExecutionRun.end_time)
+            .outerjoin(ExecutionRun, ExecutionRun.plan_id == TestPlan.id)
+            .where(TestPlan.status != TestPlanStatus.ARCHIVED.value)
+        ).all()
+
+    @staticmethod
+    def count_unarchived_results_by_run_and_status() -> dict:
+        """一条 GROUP BY 统计所有未归档计划的执行结果：{run_id: {result: count}}。"""
+        rows = db.session.execute(
+            select(ExecutionResult.run_id, ExecutionResult.result, func.count())
+            .join(ExecutionRun, ExecutionRun.id == ExecutionResult.run_id)
+            .join(TestPlan, TestPlan.id == ExecutionRun.plan_id)
+            .where(TestPlan.status != TestPlanStatus.ARCHIVED.value)
+            .group_by(ExecutionResult.run_id, ExecutionResult.result)
+        ).all()
+        counts: dict = {}
+        for run_id, result, count in rows:
+            counts.setdefault(run_id, {})[result] = count
+        return counts
+
+    @staticmethod
+    def bulk_update_runs(rows: List[dict]):
+        """按主键批量更新执行批次（每行需包含 id）。"""
+        if rows:
+            db.session.execute(update(ExecutionRun), rows)
+
+    @staticmethod
+    def mark_plans_completed(plan_ids: List[int]):
+        if plan_ids:
+            db.session.execute(
+                update(TestPlan)
+                .where(TestPlan.id.in_(plan_ids))
+                .values(status=TestPlanStatus.COMPLETED.value)
+                .execution_options(synchronize_session=False)
+            )
+
     @staticmethod
     def add_execution_result_log(log: ExecutionResultLog):
         db.session.add(log)
@@ -10,6 +10,18 @@ from extensions.database import db
 from constants.roles import SystemRole, ROLE_LABELS_ZH
 
 
+# 用户列表只需要这些列，直接投影为元组行，避免构造 ORM 实例
+_LIST_COLUMNS = (
+    User.id,
+    User.username,
+    User.role,
+    User.email,
+    User.phone,
+    User.active,
+    User.created_at,
+)
+
+
 class UserRepository:
     """
     用户与用户密码历史的仓储（数据访问）层。
@@ -60,6 +72,7 @@ class UserRepository:
              department_id=None):
         """
         返回 (items, total, dept_map)
+        items 为 (id, username, role, email, phone, active, created_at) 行元组，支持按列名取值。
         权限：
           - admin: 全量（可选指定 department_id）
           - 非 admin: 仅能查看自己所在的所有部门成员；若给 department_id 必须属于自己所在部门
@@ -136,7 +149,7 @@ class UserRepository:
             q = q.filter(User.active.is_(bool(active)))
 
         # ---------------- 排序 ----------------
-        q = q.order_by(User.id.desc())
+        q = q.order_by(User.id.desc()).with_entities(*_LIST_COLUMNS)
 
         # ---------------- 分页 ----------------
         # 保持与现有生态兼容：使用 paginate（会发 2 条 SQL，一条 count，一条数据）
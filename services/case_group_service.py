@@ -6,6 +6,7 @@ from extensions.database import db
 from utils.exceptions import BizError
 from utils.permissions import assert_user_in_department
 from repositories.case_group_repository import CaseGroupRepository
+from repositories.case_group_cache_repository import CaseGroupCacheRepository
 from models.case_group import CaseGroup
 from models.test_case import TestCase
 from models.test_case_history import TestCaseHistory
@@ -80,6 +81,7 @@ class CaseGroupService:
             updated_by=user.id
         )
         db.session.commit()
+        CaseGroupCacheRepository.invalidate_tree(department_id)
         return group
 
     @staticmethod
@@ -139,6 +141,7 @@ class CaseGroupService:
                 CaseGroupRepository.bulk_update_paths(updates)
 
             db.session.commit()
+            CaseGroupCacheRepository.invalidate_tree(group.department_id)
 
         return group
 
@@ -167,6 +170,8 @@ class CaseGroupService:
 
         # 删除分组（软删除）
         CaseGroupRepository.delete_groups_soft(group_ids, department_id=group.department_id, user_id=user.id)
+        db.session.commit()
+        CaseGroupCacheRepository.invalidate_tree(group.department_id)
 
         return deleted_case_count
 
@@ -253,10 +258,9 @@ class CaseGroupService:
         if group_ids:
             tc_query = TestCase.query.filter(
                 TestCase.department_id == source_group.department_id,
-                TestCase.group_id.in_(group_ids)
+                TestCase.group_id.in_(group_ids),
+                TestCase.is_deleted.is_(False)
             )
-            if hasattr(TestCase, "is_deleted"):
-                tc_query = tc_query.filter(TestCase.is_deleted.is_(False))
 
             for tc in tc_query:
                 test_cases_by_group[int(tc.group_id)].append(tc)
@@ -327,6 +331,7 @@ class CaseGroupService:
 
         # ⭐确保写入数据库
         db.session.commit()
+        CaseGroupCacheRepository.invalidate_tree(source_group.department_id)
         return {
             "new_root_group_id": old_id_to_new[int(source_group.id)],
             "group_count": len(created_groups),
@@ -338,24 +343,33 @@ class CaseGroupService:
     def tree(department_id: int, user, with_case_count: bool = False) -> Dict[str, Any]:
         assert_user_in_department(department_id, user)
 
-        groups = CaseGroupRepository.list_by_department(department_id)
+        # 分组结构读多写少：按部门缓存分组行，分组写操作提交后清除；用例数量随用例增删变化，不进缓存
+        # 代号须在查库前读取，见 CaseGroupCacheRepository.get_generation
+        generation = CaseGroupCacheRepository.get_generation(department_id)
+        rows = CaseGroupCacheRepository.get_tree_rows(department_id, generation)
+        if rows is None:
+            rows = [
+                {
+                    "id": g.id,
+                    "name": g.name,
+                    "path": g.path,
+                    "parent_id": g.parent_id,
+                    "order_no": g.order_no,
+                }
+                for g in CaseGroupRepository.list_by_department(department_id)
+            ]
+            CaseGroupCacheRepository.set_tree_rows(department_id, generation, rows)
+
         id_to_node = {}
-        for g in groups:
-            id_to_node[g.id] = {
-                "id": g.id,
-                "name": g.name,
-                "path": g.path,
-                "parent_id": g.parent_id,
-                "order_no": g.order_no,
-                "children": []
-            }
+        for row in rows:
+            id_to_node[row["id"]] = {**row, "children": []}
 
         # 组装层次
         roots = []
-        for g in groups:
-            node = id_to_node[g.id]
-            if g.parent_id:
-                parent_node = id_to_node.get(g.parent_id)
+        for row in rows:
+            node = id_to_node[row["id"]]
+            if row["parent_id"]:
+                parent_node = id_to_node.get(row["parent_id"])
                 if parent_node:
                     parent_node["children"].append(node)
             else:
@@ -372,7 +386,7 @@ class CaseGroupService:
 
         # 统计用例数量（可选）
         if with_case_count:
-            group_ids = [g.id for g in groups]
+            group_ids = list(id_to_node)
             counts = CaseGroupRepository.count_cases_grouped(group_ids)
             for gid, node in id_to_node.items():
                 node["case_count"] = counts.get(gid, 0)
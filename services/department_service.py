@@ -72,6 +72,11 @@ class DepartmentService:
             accessible_department_ids=accessible_ids
         )
 
+    @staticmethod
+    def get_counts(dept_ids: List[int]) -> Dict[int, Dict]:
+        """按部门批量统计成员/项目/用例/机型数量（每类一次 GROUP BY 查询）"""
+        return DepartmentRepository.get_batch_counts(list(dept_ids))
+
     @staticmethod
     def update(dept_id: int, name: Optional[str], code: Optional[str],
                description: Optional[str], active: Optional[bool]):
@@ -58,6 +58,9 @@ from utils.time_cipher import decode_encrypted_timestamp
 # derived from user-provided timestamps before persisting to the database.
 MYSQL_SIGNED_INT_MAX = 2_147_483_647
 
+# 计划用例分组筛选中表示“未分组”的取值
+_UNGROUPED_TOKENS = frozenset({"__ungrouped__", "ungrouped", "__none__"})
+
 
 class TestPlanService:
     """测试计划相关业务逻辑。"""
@@ -197,29 +200,33 @@ class TestPlanService:
         TestPlanRepository.add_execution_run(run)
         db.session.flush()
 
-        total_results = 0
+        # 初始结果行一次性批量插入，避免逐个 ORM 实例 add + flush
+        pending = ExecutionResultStatus.PENDING.value
+        result_rows = []
         for plan_case in plan.plan_cases:
             if plan_case.require_all_devices and device_model_map:
                 for device_id, plan_device in device_model_map.items():
-                    result = ExecutionResult(
-                        run_id=run.id,
-                        plan_case_id=plan_case.id,
-                        device_model_id=device_id,
-                        plan_device_model_id=plan_device.id,
-                        result=ExecutionResultStatus.PENDING.value,
+                    result_rows.append(
+                        {
+                            "run_id": run.id,
+                            "plan_case_id": plan_case.id,
+                            "device_model_id": device_id,
+                            "plan_device_model_id": plan_device.id,
+                            "result": pending,
+                        }
                     )
-                    TestPlanRepository.add_execution_result(result)
-                    total_results += 1
             else:
-                result = ExecutionResult(
-                    run_id=run.id,
-                    plan_case_id=plan_case.id,
-                    device_model_id=None,
-                    plan_device_model_id=None,
-                    result=ExecutionResultStatus.PENDING.value,
+                result_rows.append(
+                    {
+                        "run_id": run.id,
+                        "plan_case_id": plan_case.id,
+                        "device_model_id": None,
+                        "plan_device_model_id": None,
+                        "result": pending,
+                    }
                 )
-                TestPlanRepository.add_execution_result(result)
-                total_results += 1
+        TestPlanRepository.bulk_add_execution_results(result_rows)
+        total_results = len(result_rows)
 
         run.total = total_results
         run.not_run = total_results
@@ -230,7 +237,8 @@ class TestPlanService:
         run.skipped = 0
 
         TestPlanRepository.commit()
-        return TestPlanRepository.get_by_id(plan.id)
+        # 返回值用于 to_dict() 完整输出；批次只输出计数，不加载批次下的结果
+        return TestPlanRepository.get_by_id(plan.id, load_execution_run_results=False)
 
     @staticmethod
     def get(
@@ -238,9 +246,11 @@ class TestPlanService:
         *,
         current_user=None,
         permission_scope: PermissionScope | None = None,
+        **load_flags,
     ) -> TestPlan:
+        """获取计划并校验访问权限；load_flags 透传给 TestPlanRepository.get_by_id，只加载调用方用到的关系。"""
         scope = TestPlanService._require_scope(permission_scope, current_user)
-        plan = TestPlanRepository.get_by_id(plan_id)
+        plan = TestPlanRepository.get_by_id(plan_id, **load_flags)
         if not plan:
             raise BizError("测试计划不存在", 404)
         TestPlanService._ensure_plan_access(plan, scope, current_user)
@@ -277,10 +287,10 @@ class TestPlanService:
     def list_plan_cases(
         plan_id: int,
         *,
-        group_paths: Optional[Sequence[str]] = None,
+        group_paths: Optional[Iterable[str]] = None,
         title_keyword: Optional[str] = None,
-        priorities: Optional[Sequence[str]] = None,
-        statuses: Optional[Sequence[str]] = None,
+        priorities: Optional[Iterable[str]] = None,
+        statuses: Optional[Iterable[str]] = None,
         device_model_id: Optional[int] = None,
         current_user=None,
         permission_scope: PermissionScope | None = None,
@@ -306,29 +316,30 @@ class TestPlanService:
 
         cases = list(plan.plan_cases)
 
-        normalized_groups: list[str] = []
+        group_set: set[str] = set()
         include_ungrouped = False
-        if group_paths:
-            for raw in group_paths:
-                if raw is None:
-                    continue
-                value = raw.strip()
-                if not value or value.lower() in {"__ungrouped__", "ungrouped", "__none__"}:
-                    include_ungrouped = True
-                    continue
-                normalized_groups.append(value.rstrip("/"))
-        group_filter_enabled = bool(normalized_groups or include_ungrouped)
+        for raw in group_paths or ():
+            if raw is None:
+                continue
+            value = raw.strip()
+            if not value or value.lower() in _UNGROUPED_TOKENS:
+                include_ungrouped = True
+                continue
+            group_set.add(value.rstrip("/"))
+        group_filter_enabled = bool(group_set or include_ungrouped)
+        # 精确匹配走集合查找，子目录匹配交给 str.startswith(tuple)
+        group_prefixes = tuple(f"{group_path}/" for group_path in group_set)
 
         title_filter = title_keyword.strip().lower() if title_keyword else None
 
-        priority_set = {
+        priority_set = frozenset(
             priority.strip().lower()
-            for priority in priorities or []
+            for priority in priorities or ()
             if priority and priority.strip()
-        }
+        )
 
         status_set: set[str] = set()
-        for status in statuses or []:
+        for status in statuses or ():
             if not status:
                 continue
             value = status.strip().lower()
@@ -339,15 +350,8 @@ class TestPlanService:
         for plan_case in cases:
             if group_filter_enabled:
                 case_group = (plan_case.group_path_cache or "").rstrip("/")
-                matched = False
                 if case_group:
-                    for group_path in normalized_groups:
-                        if (
-                            case_group == group_path
-                            or case_group.startswith(f"{group_path}/")
-                        ):
-                            matched = True
-                            break
+                    matched = case_group in group_set or case_group.startswith(group_prefixes)
                 else:
                     matched = include_ungrouped
                 if not matched:
@@ -486,10 +490,22 @@ class TestPlanService:
         permission_scope: PermissionScope | None = None,
     ) -> TestPlan:
         scope = TestPlanService._require_scope(permission_scope, current_user)
+        # 只修改基本信息与执行人，权限校验需要 project；返回值另行完整加载
         plan = TestPlanService.get(
             plan_id,
             current_user=current_user,
             permission_scope=scope,
+            load_project=True,
+            load_creator=False,
+            load_cases=False,
+            load_case_results=False,
+            load_case_result_logs=False,
+            load_case_result_log_attachments=False,
+            load_case_result_attachments=False,
+            load_device_models=False,
+            load_testers=True,
+            load_execution_runs=False,
+            load_execution_run_results=False,
         )
         if plan.is_archived:
             raise BizError("测试计划已归档，禁止修改", 400)
@@ -536,7 +552,8 @@ class TestPlanService:
                     TestPlanRepository.add_plan_tester(plan_tester)
 
         TestPlanRepository.commit()
-        return TestPlanRepository.get_by_id(plan.id)
+        # 返回值用于 to_dict() 完整输出；批次只输出计数，不加载批次下的结果
+        return TestPlanRepository.get_by_id(plan.id, load_execution_run_results=False)
 
     @staticmethod
     def delete(
@@ -546,10 +563,22 @@ class TestPlanService:
         permission_scope: PermissionScope | None = None,
     ):
         scope = TestPlanService._require_scope(permission_scope, current_user)
+        # 子表由数据库 ON DELETE CASCADE 删除；预先加载的集合会被 ORM 逐行删除，这里只加载 project 用于权限校验
         plan = TestPlanService.get(
             plan_id,
             current_user=current_user,
             permission_scope=scope,
+            load_project=True,
+            load_creator=False,
+            load_cases=False,
+            load_case_results=False,
+            load_case_result_logs=False,
+            load_case_result_log_attachments=False,
+            load_case_result_attachments=False,
+            load_device_models=False,
+            load_testers=False,
+            load_execution_runs=False,
+            load_execution_run_results=False,
         )
         if plan.is_archived:
             raise BizError("归档状态的测试计划不可删除", 400)
@@ -630,9 +659,17 @@ class TestPlanService:
             else:
                 query = query.filter(ExecutionResult.device_model_id.is_(None))
 
-        execution_result = query.first()
+        # 锁住结果行再读取旧结果：并发提交同一结果时后到者等待先到者提交，
+        # 读到的是已更新的结果，批次计数不会被重复累加。
+        # populate_existing 保证即使会话中已有该对象，也以加锁读到的最新值覆盖
+        execution_result = (
+            query.populate_existing().with_for_update(of=ExecutionResult).first()
+        )
         if not execution_result:
             raise BizError("执行记录不存在", 404)
+        run = next((r for r in plan.execution_runs if r.id == execution_result.run_id), None)
+        if run is None:
+            raise BizError("执行批次不存在", 404)
 
         def _normalize_time_token(raw_value: Optional[str]) -> Optional[str]:
             if raw_value is None:
@@ -662,6 +699,7 @@ class TestPlanService:
             elif duration_ms_value < 0:
                 duration_ms_value = 0
 
+        previous_result = execution_result.result
         execution_result.result = result
         execution_result.executed_by = current_user.id if current_user else None
         execution_result.executed_at = datetime.utcnow()
@@ -708,15 +746,14 @@ class TestPlanService:
             execution_result.id,
             attachment_payloads,
         )
-        if attachment_payloads:
-            for payload in attachment_payloads:
-                AttachmentRepository.add_attachment(
-                    EXECUTION_RESULT_LOG_ATTACHMENT_TYPE,
-                    log.id,
-                    payload,
-                )
+        AttachmentRepository.bulk_add_attachments(
+            EXECUTION_RESULT_LOG_ATTACHMENT_TYPE,
+            log.id,
+            attachment_payloads,
+        )
 
-        TestPlanService._refresh_statistics(plan)
+        TestPlanRepository.apply_result_delta(run, previous_result, result)
+        TestPlanService._sync_run_status(plan)
         TestPlanRepository.commit()
         return execution_result
 
@@ -893,16 +930,68 @@ class TestPlanService:
         return user.id in assigned_ids
 
     @staticmethod
-    def _refresh_statistics(plan: TestPlan):
+    def _run_counters(counts: Mapping[str, int]) -> dict:
+        """由 {result: count} 计算执行批次上的各计数列。"""
+        passed = counts.get(ExecutionResultStatus.PASS.value, 0)
+        failed = counts.get(ExecutionResultStatus.FAIL.value, 0)
+        blocked = counts.get(ExecutionResultStatus.BLOCK.value, 0)
+        skipped = counts.get(ExecutionResultStatus.SKIP.value, 0)
+        total = sum(counts.values())
+        executed = passed + failed + blocked + skipped
+        return {
+            "total": total,
+            "executed": executed,
+            "passed": passed,
+            "failed": failed,
+            "blocked": blocked,
+            "skipped": skipped,
+            "not_run": total - executed,
+        }
+
+    @staticmethod
+    def reconcile_statistics(plan: TestPlan):
+        """按执行结果重新统计各批次计数（增量计数的兜底校准，可由定时任务调用）。"""
+        for run in plan.execution_runs:
+            counters = TestPlanService._run_counters(TestPlanRepository.count_results_by_status(run.id))
+            for field, value in counters.items():
+                setattr(run, field, value)
+        TestPlanService._sync_run_status(plan)
+
+    @staticmethod
+    def reconcile_all_statistics() -> int:
+        """
+        校准所有未归档测试计划的批次计数，返回处理的计划数。
+
+        与逐个调用 reconcile_statistics 的结果一致，但不加载 ORM 对象：一条 GROUP BY
+        统计全部结果，批次计数与状态按主键批量 UPDATE，全部完成的计划再一条 UPDATE 标记。
+        """
+        plan_runs = TestPlanRepository.list_unarchived_plan_runs()
+        counts_by_run = TestPlanRepository.count_unarchived_results_by_run_and_status()
+        now = datetime.utcnow()
+
+        plan_ids = set()
+        unfinished_plan_ids = set()
+        run_rows = []
+        for plan_id, run_id, end_time in plan_runs:
+            plan_ids.add(plan_id)
+            if run_id is None:
+                continue
+            row = TestPlanService._run_counters(counts_by_run.get(run_id, {}))
+            if row["not_run"] == 0:
+                row.update(status="finished", end_time=end_time or now)
+            else:
+                row.update(status="running", end_time=None)
+                unfinished_plan_ids.add(plan_id)
+            run_rows.append({"id": run_id, **row})
+
+        TestPlanRepository.bulk_update_runs(run_rows)
+        TestPlanRepository.mark_plans_completed(sorted(plan_ids - unfinished_plan_ids))
+        TestPlanRepository.commit()
+        return len(plan_ids)
+
+    @staticmethod
+    def _sync_run_status(plan: TestPlan):
         for run in plan.execution_runs:
-            results = ExecutionResult.query.filter(ExecutionResult.run_id == run.id).all()
-            run.total = len(results)
-            run.passed = sum(1 for r in results if r.result == ExecutionResultStatus.PASS.value)
-            run.failed = sum(1 for r in results if r.result == ExecutionResultStatus.FAIL.value)
-            run.blocked = sum(1 for r in results if r.result == ExecutionResultStatus.BLOCK.value)
-            run.skipped = sum(1 for r in results if r.result == ExecutionResultStatus.SKIP.value)
-            run.executed = run.passed + run.failed + run.blocked + run.skipped
-            run.not_run = run.total - run.executed
             if run.not_run == 0:
                 run.status = "finished"
                 run.end_time = run.end_time or datetime.utcnow()
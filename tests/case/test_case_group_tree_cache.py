@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""分组树缓存：写操作后失效、并发回写不覆盖新数据、Redis 不可用时回退数据库。"""
+
+from __future__ import annotations
+
+import pytest
+
+import redis
+from extensions import redis_client
+from extensions.database import db
+from repositories.case_group_cache_repository import CaseGroupCacheRepository
+from services.case_group_service import CaseGroupService
+from tests.utils.db_factories import create_admin, create_department
+
+
+class _BrokenRedis(redis.RedisStub):
+    """所有命令均抛出 RedisError，模拟 Redis 宕机。"""
+
+    def get(self, *args, **kwargs):
+        raise redis.RedisError("connection refused")
+
+    def setex(self, *args, **kwargs):
+        raise redis.RedisError("connection refused")
+
+    def incr(self, *args, **kwargs):
+        raise redis.RedisError("connection refused")
+
+
+@pytest.fixture(autouse=True)
+def redis_stub(monkeypatch):
+    """每个用例使用独立的 RedisStub，缓存互不干扰。"""
+
+    monkeypatch.setattr(redis_client, "_redis_client", redis.RedisStub("redis://test"))
+
+
+def _bootstrap():
+    department = create_department()
+    admin = create_admin()
+    db.session.commit()
+    return department.id, admin
+
+
+def _paths(node) -> set[str]:
+    paths = set()
+    for child in node["children"]:
+        paths.add(child["path"])
+        paths |= _paths(child)
+    return paths
+
+
+def test_tree_cache_invalidated_by_create_move_and_delete(app_context):
+    dept_id, admin = _bootstrap()
+    parent = CaseGroupService.create(dept_id, "A", admin)
+    child = CaseGroupService.create(dept_id, "B", admin)
+    assert _paths(CaseGroupService.tree(dept_id, admin)) == {"root/A", "root/B"}
+
+    # 创建
+    CaseGroupService.create(dept_id, "C", admin, parent_id=parent.id)
+    assert _paths(CaseGroupService.tree(dept_id, admin)) == {"root/A", "root/A/C", "root/B"}
+
+    # 移动
+    CaseGroupService.update(child.id, admin, parent_id=parent.id)
+    assert _paths(CaseGroupService.tree(dept_id, admin)) == {"root/A", "root/A/B", "root/A/C"}
+
+    # 删除（含子树）
+    CaseGroupService.delete(parent.id, admin)
+    assert _paths(CaseGroupService.tree(dept_id, admin)) == set()
+
+
+def test_tree_served_from_cache_until_invalidated(app_context):
+    dept_id, admin = _bootstrap()
+    CaseGroupService.create(dept_id, "A", admin)
+    generation = CaseGroupCacheRepository.get_generation(dept_id)
+    CaseGroupService.tree(dept_id, admin)
+
+    rows = CaseGroupCacheRepository.get_tree_rows(dept_id, generation)
+    assert [row["path"] for row in rows] == ["root/A"]
+
+
+def test_stale_write_after_invalidate_is_not_served(app_context):
+    dept_id, admin = _bootstrap()
+    CaseGroupService.create(dept_id, "A", admin)
+
+    # 读者在写操作提交前读取代号并查库，写操作失效缓存后才回写旧数据
+    generation = CaseGroupCacheRepository.get_generation(dept_id)
+    stale_rows = [{"id": 999, "name": "stale", "path": "root/stale", "parent_id": None, "order_no": 0}]
+    CaseGroupService.create(dept_id, "B", admin)
+    CaseGroupCacheRepository.set_tree_rows(dept_id, generation, stale_rows)
+
+    assert _paths(CaseGroupService.tree(dept_id, admin)) == {"root/A", "root/B"}
+
+
+def test_tree_and_writes_fall_back_when_redis_is_down(app_context, monkeypatch):
+    monkeypatch.setattr(redis_client, "_redis_client", _BrokenRedis("redis://down"))
+    dept_id, admin = _bootstrap()
+
+    group = CaseGroupService.create(dept_id, "A", admin)
+    assert group.id is not None
+    assert _paths(CaseGroupService.tree(dept_id, admin)) == {"root/A"}
+    CaseGroupService.delete(group.id, admin)
+    assert _paths(CaseGroupService.tree(dept_id, admin)) == set()
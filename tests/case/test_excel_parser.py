@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""单元测试：Excel 用例解析（controllers/up_files.py）。"""
+
+from pathlib import Path
+
+import pytest
+
+from controllers.up_files import (
+    _classify_rows,
+    extract_title_and_keywords,
+    is_title_row,
+    parse_excel_cases,
+    split_numbered,
+)
+
+SAMPLE_PATH = Path(__file__).resolve().parents[2] / "controllers" / "01 Mouse Test information.xlsx"
+
+
+@pytest.fixture(scope="module")
+def sample_bytes() -> bytes:
+    if not SAMPLE_PATH.exists():
+        pytest.skip("示例 Excel 文件不存在")
+    return SAMPLE_PATH.read_bytes()
+
+
+def test_parse_sample_workbook(sample_bytes):
+    folder, cases = parse_excel_cases(sample_bytes)
+
+    assert folder == "Cleansheet mouse"
+    assert len(cases) == 15
+    assert [case["order"] for case in cases] == list(range(1, 16))
+
+    first = cases[0]
+    assert first["title"] == "Preparation"
+    assert first["keywords"] == ["时间+1"]
+    assert first["expected_result"] == "1.确认更新并记录测试环境"
+    assert first["steps"][0]["no"] == 1
+    assert first["steps"][0]["action"].startswith("Preparation test units")
+    assert {"keyword", "note", "expected"} <= set(first["steps"][0])
+
+    assert cases[1]["keywords"] == ["时间+1", "s3+5"]
+    assert [len(case["steps"]) for case in cases] == [1, 6, 5, 4, 4, 5, 3, 3, 4, 10, 6, 2, 1, 1, 1]
+
+
+def test_parse_accepts_file_object(sample_bytes):
+    with SAMPLE_PATH.open("rb") as fp:
+        fp.read(16)  # 已被读取过的文件对象也应从头解析
+        folder, cases = parse_excel_cases(fp)
+
+    assert (folder, cases) == parse_excel_cases(sample_bytes)
+
+
+def test_parse_accepts_path(sample_bytes):
+    assert parse_excel_cases(SAMPLE_PATH) == parse_excel_cases(sample_bytes)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", []),
+        ("单行步骤", [(1, "单行步骤")]),
+        ("第一行\n第二行", [(1, "第一行"), (2, "第二行")]),
+        ("1.打开设备\n2、连接电脑\n3) 检查指示灯", [(1, "打开设备"), (2, "连接电脑"), (3, "检查指示灯")]),
+        ("准备工作\n1. 上电\n2. 配对", [(1, "准备工作"), (1, "上电"), (2, "配对")]),
+    ],
+)
+def test_split_numbered(text, expected):
+    assert split_numbered(text) == expected
+
+
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        ("快速配对 [时间+1]", ("快速配对", ["时间+1"])),
+        ("[A] 鼠标  上电 [ B ] -", ("鼠标 上电", ["A", "B"])),
+        ("无关键词", ("无关键词", [])),
+        ("", ("", [])),
+    ],
+)
+def test_extract_title_and_keywords(title, expected):
+    assert extract_title_and_keywords(title) == expected
+
+
+def test_classify_rows_matches_scalar_checks():
+    col_a = ["Section : 1", "Phase :x", "  快速配对  ", "1.上电", "", None, "nan", "Workloading : 2"]
+    col_e = [None, "", None, "预期", "预期", None, "", "  "]
+
+    title_mask, step_mask = _classify_rows(col_a, col_e)
+
+    assert title_mask.tolist() == [is_title_row(col_a, col_e, i) for i in range(len(col_a))]
+    assert title_mask.tolist() == [False, False, True, False, False, False, False, False]
+    assert step_mask.tolist() == [False, False, False, True, False, False, False, False]
@@ -150,3 +150,17 @@ def make_test_case(api_client):
         assert resp.get("_http_status") in (200, 201), f"创建用例失败: {resp}"
         return resp["data"]
     return _create
+
+
+@pytest.fixture()
+def app_context():
+    """提供测试用的 Flask 应用上下文（使用内存数据库），供不依赖测试服务器的单元测试使用。"""
+    from app import create_app
+    from extensions.database import db
+
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""查询次数回归测试：列表与删除的 SQL 条数不应随数据量增长（防止 N+1 回归）。"""
+
+from __future__ import annotations
+
+from sqlalchemy import update
+
+from extensions.database import db
+from models import DepartmentMember, DeviceModel, Project, TestCase, User
+from models.execution import ExecutionRun
+from repositories.test_plan_repository import TestPlanRepository
+from services.test_plan_service import TestPlanService
+from constants.department_roles import DepartmentRole
+from utils.permissions import build_permission_scope
+from tests.utils.db_factories import create_admin, create_department, random_text
+from tests.utils.query_counter import count_queries, forbid_lazy_loads
+
+
+def _bootstrap() -> dict[str, object]:
+    department = create_department()
+    admin = create_admin()
+    project = Project(department=department, name=random_text("Project"), code=random_text("PRJ"))
+    device = DeviceModel(
+        department=department, name=random_text("Device"), category="headset", model_code=random_text("MDL")
+    )
+    cases = [
+        TestCase(department=department, title=random_text("Case"), steps=[], keywords=[], priority="P1")
+        for _ in range(3)
+    ]
+    db.session.add_all([project, device, *cases])
+    db.session.flush()
+    db.session.add(DepartmentMember(department_id=department.id, user_id=admin.id, role=DepartmentRole.ADMIN.value))
+    db.session.flush()
+    return {"project": project, "device": device, "cases": cases, "admin": admin}
+
+
+def _create_plan(env: dict[str, object], creator: User | None = None):
+    user = creator or env["admin"]
+    return TestPlanService.create(
+        current_user=user,
+        project_id=env["project"].id,
+        name=random_text("Plan"),
+        status="active",
+        case_ids=[case.id for case in env["cases"]],
+        case_group_ids=[],
+        single_execution_case_ids=[],
+        device_model_ids=[env["device"].id],
+        tester_user_ids=[env["admin"].id],
+        permission_scope=build_permission_scope(user),
+    )
+
+
+def _list_and_serialize() -> tuple[int, int, int]:
+    db.session.expire_all()
+    with forbid_lazy_loads():
+        with count_queries() as load_statements:
+            items, _ = TestPlanRepository.list(page=1, page_size=20)
+        with count_queries() as serialize_statements:
+            payload = [plan.to_dict(include_cases=False, include_runs=False) for plan in items]
+    return len(payload), len(load_statements), len(serialize_statements)
+
+
+def test_plan_list_query_count_independent_of_plan_count(app_context):
+    """计划列表的 SQL 条数为常数，序列化阶段不再触发懒加载。"""
+
+    env = _bootstrap()
+    _create_plan(env)
+    db.session.commit()
+    plans, baseline_load, baseline_serialize = _list_and_serialize()
+    assert plans == 1
+    assert baseline_serialize == 0
+
+    for _ in range(3):
+        _create_plan(env, create_admin("creator"))
+    db.session.commit()
+
+    plans, load, serialize = _list_and_serialize()
+    assert plans == 4
+    assert load == baseline_load
+    assert serialize == 0
+
+
+def test_plan_delete_leaves_children_to_database_cascade(app_context):
+    """删除计划只发一条 DELETE，用例/批次/结果由外键 ON DELETE CASCADE 清理。"""
+
+    env = _bootstrap()
+    plan = _create_plan(env)
+    plan_id = plan.id
+    db.session.commit()
+    db.session.expire_all()
+
+    with count_queries() as statements:
+        TestPlanService.delete(
+            plan_id,
+            current_user=env["admin"],
+            permission_scope=build_permission_scope(env["admin"]),
+        )
+
+    deletes = [s for s in statements if s.lstrip().upper().startswith("DELETE")]
+    assert len(deletes) == 1
+    assert "test_plan" in deletes[0]
+
+
+def test_reconcile_all_statistics_is_set_based(app_context):
+    """全量校准的 SQL 条数与计划数无关，且能修正被改乱的批次计数。"""
+
+    env = _bootstrap()
+    plans = [_create_plan(env) for _ in range(2)]
+    db.session.commit()
+    with count_queries() as baseline:
+        assert TestPlanService.reconcile_all_statistics() == 2
+
+    plans += [_create_plan(env) for _ in range(3)]
+    db.session.commit()
+    db.session.execute(update(ExecutionRun).values(total=0, not_run=0, passed=7, status="finished"))
+    db.session.commit()
+
+    with count_queries() as statements:
+        assert TestPlanService.reconcile_all_statistics() == 5
+    assert len(statements) == len(baseline)
+
+    db.session.expire_all()
+    for plan in plans:
+        for run in plan.execution_runs:
+            results = len(run.execution_results)
+            assert results > 0
+            assert (run.total, run.not_run, run.passed, run.status) == (results, results, 0, "running")
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""执行结果附件替换：按存储名复用原行时需同步提交的元数据。"""
+
+from __future__ import annotations
+
+from extensions.database import db
+from models.attachment import Attachment
+from models.execution import EXECUTION_RESULT_ATTACHMENT_TYPE
+from repositories.attachment_repository import AttachmentRepository
+from tests.utils.query_counter import count_queries
+
+
+def _payload(stored_file_name: str, **overrides) -> dict:
+    payload = {
+        "file_name": f"{stored_file_name}.log",
+        "stored_file_name": stored_file_name,
+        "file_path": f"/attachments/{stored_file_name}",
+        "mime_type": "text/plain",
+        "size": 10,
+        "uploaded_by": None,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _attachments(target_id: int) -> dict[str, Attachment]:
+    db.session.expire_all()
+    rows = Attachment.query.filter_by(target_type=EXECUTION_RESULT_ATTACHMENT_TYPE, target_id=target_id).all()
+    return {row.stored_file_name: row for row in rows}
+
+
+def test_resubmitted_attachment_updates_metadata_in_place(app_context):
+    """同一存储名再次提交时保留原行 id，文件名、路径、类型、大小更新为新值。"""
+
+    AttachmentRepository.replace_target_attachments(
+        EXECUTION_RESULT_ATTACHMENT_TYPE, 1, [_payload("a"), _payload("b")]
+    )
+    db.session.commit()
+    before = {name: row.id for name, row in _attachments(1).items()}
+
+    AttachmentRepository.replace_target_attachments(
+        EXECUTION_RESULT_ATTACHMENT_TYPE,
+        1,
+        [_payload("a", file_name="renamed.log", file_path="/moved/a", mime_type="application/zip", size=99)],
+    )
+    db.session.commit()
+
+    after = _attachments(1)
+    assert set(after) == {"a"}
+    updated = after["a"]
+    assert updated.id == before["a"]
+    assert (updated.file_name, updated.file_path, updated.mime_type, updated.size) == (
+        "renamed.log",
+        "/moved/a",
+        "application/zip",
+        99,
+    )
+
+
+def test_unchanged_attachment_is_not_rewritten(app_context):
+    """元数据未变化的附件不发 UPDATE。"""
+
+    AttachmentRepository.replace_target_attachments(EXECUTION_RESULT_ATTACHMENT_TYPE, 2, [_payload("a")])
+    db.session.commit()
+
+    with count_queries() as statements:
+        AttachmentRepository.replace_target_attachments(EXECUTION_RESULT_ATTACHMENT_TYPE, 2, [_payload("a")])
+    assert not [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+直连内存数据库的单元测试使用的数据构造辅助函数（配合 tests/conftest.py 中的 app_context）。
+"""
+
+import uuid
+
+from constants.roles import SystemRole
+from extensions.database import db
+from models import Department, User
+
+
+def random_text(prefix: str) -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+
+
+def create_admin(prefix: str = "admin") -> User:
+    """创建系统管理员（全局管理员可访问所有部门）。"""
+    admin = User(username=random_text(prefix), password_hash="hash", role=SystemRole.ADMIN.value)
+    db.session.add(admin)
+    db.session.flush()
+    return admin
+
+
+def create_department() -> Department:
+    department = Department(name=random_text("Dept"), code=random_text("D"))
+    db.session.add(department)
+    db.session.flush()
+    return department
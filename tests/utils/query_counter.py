@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""统计代码块内发出的 SQL 语句、拦截懒加载，供查询次数相关的测试使用。"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from extensions.database import db
+
+
+@contextmanager
+def count_queries():
+    """统计代码块内发出的 SQL 语句，yield 的列表依次记录每条语句。"""
+
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@contextmanager
+def forbid_lazy_loads():
+    """
+    代码块内出现按行补充的加载即判测试失败：关系懒加载，以及延迟/过期列的补充查询。
+
+    用于包住列表接口的"查询 + 序列化"阶段；selectinload 等显式预加载不受影响。
+    """
+
+    lazy_loads: list[str] = []
+
+    def _do_orm_execute(orm_execute_state):
+        if orm_execute_state.lazy_loaded_from is not None:
+            owner = orm_execute_state.lazy_loaded_from.class_.__name__
+            lazy_loads.append(f"懒加载 {owner}: {orm_execute_state.statement}")
+        elif orm_execute_state.is_column_load:
+            lazy_loads.append(f"列补充加载: {orm_execute_state.statement}")
+
+    event.listen(Session, "do_orm_execute", _do_orm_execute)
+    try:
+        yield
+    finally:
+        event.remove(Session, "do_orm_execute", _do_orm_execute)
+    assert not lazy_loads, "出现逐行加载（N+1）：\n" + "\n".join(lazy_loads)
@@ -39,6 +39,11 @@ def test_to_beijing_time_from_aware_non_utc():
             datetime(2025, 10, 20, 16, 0, 0, tzinfo=timezone.utc),
             "2025-10-21T00:00:00+08:00",
         ),
+        (datetime(2025, 12, 31, 20, 30, 0, 123456), "2026-01-01T04:30:00.123456+08:00"),
+        (
+            datetime(2025, 10, 20, 18, 0, 0, tzinfo=timezone(timedelta(hours=2))),
+            "2025-10-21T00:00:00+08:00",
+        ),
         (None, None),
     ],
 )
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""列表接口的查询 + 序列化阶段不应出现逐行懒加载（strict() 覆盖的列表查询）。"""
+
+from __future__ import annotations
+
+import pytest
+
+from extensions.database import db
+from models import CaseGroup, DeviceModel, TestCase
+from repositories.case_group_repository import CaseGroupRepository
+from repositories.department_repository import DepartmentRepository
+from repositories.device_model_repository import DeviceModelRepository
+from tests.utils.db_factories import create_department, random_text
+from tests.utils.query_counter import forbid_lazy_loads
+
+
+def _bootstrap():
+    department = create_department()
+    db.session.add_all(
+        [
+            DeviceModel(
+                department=department,
+                name=random_text("Device"),
+                category="headset",
+                model_code=random_text("MDL"),
+            )
+            for _ in range(3)
+        ]
+    )
+    db.session.add_all(
+        [CaseGroup(department_id=department.id, name=random_text("Group"), path="/") for _ in range(3)]
+    )
+    db.session.commit()
+    db.session.expire_all()
+    return department.id
+
+
+def test_department_list_has_no_lazy_loads(app_context):
+    _bootstrap()
+    with forbid_lazy_loads():
+        departments, total, counts_data = DepartmentRepository.list()
+        items = [d.to_dict(counts_data=counts_data) for d in departments]
+    assert len(items) == total == 1
+
+
+def test_device_model_list_has_no_lazy_loads(app_context):
+    department_id = _bootstrap()
+    with forbid_lazy_loads():
+        devices, total = DeviceModelRepository.list(department_id=department_id)
+        items = [device.to_dict() for device in devices]
+    assert len(items) == total == 3
+
+
+def test_case_group_children_have_no_lazy_loads(app_context):
+    department_id = _bootstrap()
+    with forbid_lazy_loads():
+        groups = CaseGroupRepository.list_children(department_id, None)
+        items = [(g.id, g.name, g.path, g.parent_id, g.order_no) for g in groups]
+    assert len(items) == 3
+
+
+def test_guard_reports_lazy_loads(app_context):
+    """守卫本身：访问未预加载的关系时判失败。"""
+
+    department_id = _bootstrap()
+    db.session.add(TestCase(department_id=department_id, title=random_text("Case"), steps=[], priority="P1"))
+    db.session.commit()
+    db.session.expire_all()
+    case = TestCase.query.first()
+    with pytest.raises(AssertionError, match="懒加载 TestCase"):
+        with forbid_lazy_loads():
+            case.department
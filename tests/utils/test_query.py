@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import pytest
+from sqlalchemy import ForeignKey, create_engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship, selectinload
+
+from utils.query import strict
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list["Child"]] = relationship(back_populates="parent")
+
+
+class Child(Base):
+    __tablename__ = "child"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parent.id"))
+    parent: Mapped[Parent] = relationship(back_populates="children")
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        s.add(Parent(id=1, children=[Child(id=1), Child(id=2)]))
+        s.commit()
+        s.expunge_all()
+        yield s
+
+
+def test_strict_raises_on_lazy_load(session):
+    parent = session.execute(strict(select(Parent))).scalar_one()
+
+    assert parent.id == 1
+    with pytest.raises(InvalidRequestError):
+        parent.children
+
+
+def test_strict_keeps_explicit_loaders(session):
+    parent = session.execute(strict(select(Parent), selectinload(Parent.children))).scalar_one()
+
+    assert sorted(c.id for c in parent.children) == [1, 2]
+    with pytest.raises(InvalidRequestError):
+        parent.children[0].parent
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 BEIJING_TZ = timezone(timedelta(hours=8))
+_BEIJING_OFFSET = timedelta(hours=8)
 
 
 def _ensure_utc(dt: datetime) -> datetime:
@@ -37,5 +38,9 @@ def datetime_to_beijing_iso(dt: Optional[datetime]) -> Optional[str]:
 
     if dt is None:
         return None
-    return to_beijing_time(dt).isoformat()
+    if dt.tzinfo is None:
+        # 数据库取出的时间均为 naive UTC：直接平移 8 小时并标注东八区，
+        # 结果与 to_beijing_time 相同，但省去两次 astimezone 换算（列表序列化的热点）
+        return (dt + _BEIJING_OFFSET).replace(tzinfo=BEIJING_TZ).isoformat()
+    return dt.astimezone(BEIJING_TZ).isoformat()
 
@@ -4,9 +4,11 @@ from dataclasses import dataclass, field
 from typing import Dict, Iterable, Optional, Sequence, Set
 
 from flask import g
+from sqlalchemy import lambda_stmt, select
 
 from constants.roles import SystemRole
 from constants.department_roles import DepartmentRole
+from extensions.database import db
 from models.department import DepartmentMember
 from utils.exceptions import BizError
 
@@ -114,12 +116,16 @@ def get_permission_scope(default=None) -> PermissionScope | None:
 def get_department_scope(user) -> Dict[int, Set[str]]:
     if not user:
         return {}
-    memberships = (
-        DepartmentMember.query.filter(DepartmentMember.user_id == user.id).all()
+    user_id = user.id
+    # 每个鉴权请求都会执行：lambda_stmt 缓存语句构造与缓存键，只取两列也免去 ORM 实体装配
+    stmt = lambda_stmt(
+        lambda: select(DepartmentMember.department_id, DepartmentMember.role).where(
+            DepartmentMember.user_id == user_id
+        )
     )
     scope: Dict[int, Set[str]] = {}
-    for membership in memberships:
-        scope.setdefault(membership.department_id, set()).add(membership.role)
+    for department_id, role in db.session.execute(stmt):
+        scope.setdefault(department_id, set()).add(role)
     return scope
 
 
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+查询辅助工具。
+"""
+
+from sqlalchemy.orm import raiseload
+
+
+def strict(stmt, *loaders):
+    """
+    为列表查询追加显式加载策略，其余关系一律 raiseload。
+
+    序列化时若误触未预加载的关系会直接抛出 InvalidRequestError，
+    而不是逐行静默发起懒加载（N+1）。同时适用于 select() 与 Model.query。
+    """
+    return stmt.options(*loaders, raiseload("*"))
@@ -1,8 +1,26 @@
-from flask import jsonify
+from decimal import Decimal
 
+import orjson
+from flask import current_app
 
-def json_response(message="success", data=None, code=200):
-    resp = jsonify({"code": code, "message": message, "data": data})
-    resp.status_code = code
-    return resp
+# datetime/date/UUID/dataclass/numpy 由 orjson 在 C 层直接序列化（时间输出 ISO 8601，与 isoformat() 一致）；
+# 非字符串键（如按 id 聚合的统计字典）与 Flask 默认行为一样转成字符串
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj):
+    """orjson 不认识的类型，沿用 Flask 默认 JSON provider 的处理方式。"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
+
+def json_response(message="success", data=None, code=200):
+    body = orjson.dumps(
+        {"code": code, "message": message, "data": data},
+        default=_default,
+        option=_DUMPS_OPTIONS,
+    )
+    return current_app.response_class(body, status=code, mimetype="application/json")